@@ -9,11 +9,13 @@ Launches the Streamlit UI.
 import sys
 import os
 from pathlib import Path
-from streamlit.web import cli as stcli
 
 
 def main():
     """Launch Streamlit UI."""
+    # Imported here so importing the package entry point stays cheap
+    from streamlit.web import cli as stcli
+
     # Get the path to streamlit_app.py
     app_path = Path(__file__).parent / "ui" / "streamlit_app.py"
 
@@ -5,7 +5,6 @@ This agent generates complete landing pages with customer branding.
 
 import logging
 
-from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.runnables.config import RunnableConfig
 
 from braze_code_gen.core.llm_factory import create_llm
@@ -13,7 +12,12 @@ from braze_code_gen.core.models import GeneratedCode, ModelTier
 from braze_code_gen.core.state import CodeGenerationState
 from braze_code_gen.utils.html_template import generate_base_template
 from braze_code_gen.utils.html_utils import clean_html_response
-from braze_code_gen.prompts.BRAZE_PROMPTS import CODE_GENERATION_AGENT_PROMPT
+from braze_code_gen.utils.prompt_utils import build_messages
+from braze_code_gen.prompts.BRAZE_PROMPTS import (
+    CODE_GENERATION_AGENT_PROMPT,
+    CODE_GENERATION_AGENT_REFERENCE_HEADER,
+    CODE_GENERATION_BRIEF_TEMPLATE,
+)
 from braze_code_gen.prompts.sdk_reference import SDK_REFERENCE_EXAMPLES
 
 logger = logging.getLogger(__name__)
@@ -33,7 +37,11 @@ class CodeGenerationAgent:
             model_tier: LLM tier to use (primary/research/validation)
             temperature: Temperature for generation
         """
-        self.llm = create_llm(tier=model_tier, temperature=temperature)
+        self.llm = create_llm(
+            tier=model_tier,
+            temperature=temperature,
+            cache_key="braze-code-generation"
+        )
 
     def process(self, state: CodeGenerationState, config: RunnableConfig) -> dict:
         """Generate complete HTML landing page with Braze SDK.
@@ -77,24 +85,25 @@ class CodeGenerationAgent:
         else:
             research_summary = "No research was conducted"
 
-        # Format prompt
-        prompt = CODE_GENERATION_AGENT_PROMPT.format(
+        # Format the per-request brief (static instructions and SDK reference
+        # stay ahead of it so the prompt prefix is cacheable)
+        brief = CODE_GENERATION_BRIEF_TEMPLATE.format(
             feature_plan=self._format_feature_plan(feature_plan),
-            research_summary=research_summary,
             primary_color=branding_data.colors.primary,
             accent_color=branding_data.colors.accent,
             primary_font=branding_data.typography.primary_font,
             heading_font=branding_data.typography.heading_font,
-            base_template="[Base template with Braze SDK initialization and styling]",
-            sdk_reference_examples=SDK_REFERENCE_EXAMPLES
+            base_template=base_template
         )
 
         # Generate code
         try:
-            messages = [
-                SystemMessage(content=prompt),
-                HumanMessage(content=f"Generate the complete HTML landing page.\n\nBase template:\n{base_template}")
-            ]
+            messages = build_messages(
+                static_system=CODE_GENERATION_AGENT_PROMPT,
+                static_reference_blocks=[CODE_GENERATION_AGENT_REFERENCE_HEADER, SDK_REFERENCE_EXAMPLES],
+                dynamic_user=brief,
+                dynamic_tools=[f"## Research Results\n\n{research_summary}"]
+            )
 
             # Pass config to LLM invoke for token streaming callbacks
             response = self.llm.invoke(messages, config=config)
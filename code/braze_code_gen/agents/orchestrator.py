@@ -5,17 +5,16 @@ the ChatInterface for compatibility with the reference agent framework.
 """
 
 import logging
+import os
 from typing import List, Dict, Optional, Generator, Any
 from threading import Event
 
-from langchain_openai import ChatOpenAI
 from langchain_core.callbacks.base import BaseCallbackHandler
-from opik.integrations.langchain import OpikTracer
 
 from braze_code_gen.core.state import CodeGenerationState, create_initial_state
 from braze_code_gen.core.models import BrazeAPIConfig
 from braze_code_gen.core.workflow import create_workflow
-from braze_code_gen.agents.planning_agent import PlanningAgent
+from braze_code_gen.agents.planning_agent import PlanningAgent, URL_PATTERN
 from braze_code_gen.agents.research_agent import ResearchAgent
 from braze_code_gen.agents.code_generation_agent import CodeGenerationAgent
 from braze_code_gen.agents.validation_agent import ValidationAgent
@@ -83,9 +82,25 @@ class Orchestrator:
             finalization_agent=self.finalization_agent
         )
 
-        # Initialize Opik tracer
+        # Initialize Opik tracer (opt-in: tracing serializes every node's
+        # inputs/outputs, so it stays off unless explicitly enabled)
         self.tracer = None
+        if os.getenv("OPIK_ENABLED") != "1":
+            logger.info("Opik tracing disabled (set OPIK_ENABLED=1 to enable)")
+        else:
+            self._initialize_tracer(opik_project_name)
+
+        logger.info("Orchestrator initialized successfully")
+
+    def _initialize_tracer(self, opik_project_name: str):
+        """Initialize the Opik tracer for the compiled workflow graph.
+
+        Args:
+            opik_project_name: Opik project name for tracing
+        """
         try:
+            from opik.integrations.langchain import OpikTracer
+
             self.tracer = OpikTracer(
                 graph=self.workflow.graph.get_graph(xray=True),
                 project_name=opik_project_name
@@ -94,8 +109,6 @@ class Orchestrator:
         except Exception as e:
             logger.warning(f"Could not initialize Opik tracing: {e}")
 
-        logger.info("Orchestrator initialized successfully")
-
     def _initialize_agents(self):
         """Initialize all agent instances."""
         from braze_code_gen.core.models import ModelTier
@@ -145,7 +158,8 @@ class Orchestrator:
         self,
         user_message: str,
         website_url: Optional[str] = None,
-        max_refinement_iterations: int = 3
+        max_refinement_iterations: int = 3,
+        braze_api_config: Optional[BrazeAPIConfig] = None
     ) -> Dict[str, Any]:
         """Generate landing page with blocking execution.
 
@@ -153,11 +167,13 @@ class Orchestrator:
             user_message: User's feature request
             website_url: Optional customer website URL for branding
             max_refinement_iterations: Maximum refinement attempts
+            braze_api_config: Per-call API configuration (defaults to the one set on the orchestrator)
 
         Returns:
             dict: Final workflow state with generated code and export path
         """
-        if not self.braze_api_config:
+        braze_api_config = braze_api_config or self.braze_api_config
+        if not braze_api_config:
             raise ValueError("Braze API configuration not set. Call set_braze_api_config() first.")
 
         logger.info(f"Starting landing page generation: {user_message[:100]}...")
@@ -165,7 +181,7 @@ class Orchestrator:
         # Create initial state
         state = create_initial_state(
             user_message=user_message,
-            braze_api_config=self.braze_api_config,
+            braze_api_config=braze_api_config,
             customer_website_url=website_url,
             max_refinement_iterations=max_refinement_iterations
         )
@@ -186,7 +202,8 @@ class Orchestrator:
         website_url: Optional[str] = None,
         max_refinement_iterations: int = 3,
         callbacks: Optional[List[BaseCallbackHandler]] = None,
-        stop_event: Optional[Event] = None
+        stop_event: Optional[Event] = None,
+        braze_api_config: Optional[BrazeAPIConfig] = None
     ) -> Generator[Dict[str, Any], None, None]:
         """Generate landing page with streaming updates.
 
@@ -199,6 +216,8 @@ class Orchestrator:
             max_refinement_iterations: Maximum refinement attempts
             callbacks: Optional LangChain callbacks for token streaming
             stop_event: Optional threading.Event for cancellation signaling
+            braze_api_config: Per-call API configuration (defaults to the one set on the
+                orchestrator); lets one orchestrator be shared across UI sessions
 
         Yields:
             dict: Update dictionaries:
@@ -207,7 +226,8 @@ class Orchestrator:
                 - {"type": "error", "message": str}
                 - {"type": "final_state", "state": dict}
         """
-        if not self.braze_api_config:
+        braze_api_config = braze_api_config or self.braze_api_config
+        if not braze_api_config:
             yield {
                 "type": "error",
                 "message": "Braze API configuration not set. Please configure API first."
@@ -219,7 +239,7 @@ class Orchestrator:
         # Create initial state
         state = create_initial_state(
             user_message=user_message,
-            braze_api_config=self.braze_api_config,
+            braze_api_config=braze_api_config,
             customer_website_url=website_url,
             max_refinement_iterations=max_refinement_iterations
         )
@@ -272,10 +292,8 @@ class Orchestrator:
         """
         try:
             # Extract website URL from message if present
-            import re
-            url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-            urls = re.findall(url_pattern, message)
-            website_url = urls[0] if urls else None
+            url_match = URL_PATTERN.search(message)
+            website_url = url_match.group(0) if url_match else None
 
             # Generate landing page
             result = self.generate(
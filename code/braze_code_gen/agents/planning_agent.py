@@ -5,6 +5,7 @@ This agent analyzes user requests, extracts website URLs, and creates feature pl
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, Dict
 
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -23,6 +24,10 @@ from braze_code_gen.prompts.BRAZE_PROMPTS import format_planning_agent_prompt
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; also used by the orchestrator to pull URLs out of chat messages
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+DOMAIN_PATTERN = re.compile(r'\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}\b')
+
 
 class PlanningAgent:
     """Planning agent for feature planning and branding extraction."""
@@ -39,6 +44,8 @@ class PlanningAgent:
             temperature: Temperature for generation
         """
         self.llm = create_llm(tier=model_tier, temperature=temperature)
+        # Bind the feature-plan schema once rather than on every request
+        self.plan_llm = self.llm.with_structured_output(SDKFeaturePlan)
         self.website_analyzer = WebsiteAnalyzer()
 
     def process(self, state: CodeGenerationState, config: RunnableConfig) -> dict:
@@ -111,9 +118,13 @@ class PlanningAgent:
             "next_step": "research"
         }
 
-    def _extract_url_from_message(self, message: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_url_from_message(message: str) -> Optional[str]:
         """Extract website URL from user message.
 
+        Pure function of the message, so results are memoized.
+
         Args:
             message: User message
 
@@ -121,15 +132,13 @@ class PlanningAgent:
             Optional[str]: Extracted URL or None
         """
         # Pattern for URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, message)
+        url_match = URL_PATTERN.search(message)
 
-        if urls:
-            return urls[0]
+        if url_match:
+            return url_match.group(0)
 
         # Try to find domain-like patterns
-        domain_pattern = r'\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}\b'
-        domains = re.findall(domain_pattern, message)
+        domains = DOMAIN_PATTERN.findall(message)
 
         if domains:
             # Filter out common non-domain words
@@ -187,7 +196,7 @@ class PlanningAgent:
         try:
             # Use structured output (Pydantic model)
             # Pass config to LLM invoke for token streaming callbacks
-            response = self.llm.with_structured_output(SDKFeaturePlan).invoke(messages, config=config)
+            response = self.plan_llm.invoke(messages, config=config)
             return response
 
         except Exception as e:
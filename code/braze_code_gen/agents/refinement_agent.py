@@ -5,14 +5,17 @@ This agent applies targeted fixes to resolve validation issues.
 
 import logging
 
-from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.runnables.config import RunnableConfig
 
 from braze_code_gen.core.llm_factory import create_llm
 from braze_code_gen.core.models import GeneratedCode, ModelTier
 from braze_code_gen.core.state import CodeGenerationState
 from braze_code_gen.utils.html_utils import clean_html_response
-from braze_code_gen.prompts.BRAZE_PROMPTS import REFINEMENT_AGENT_PROMPT
+from braze_code_gen.utils.prompt_utils import build_messages
+from braze_code_gen.prompts.BRAZE_PROMPTS import (
+    REFINEMENT_AGENT_PROMPT,
+    REFINEMENT_BRIEF_TEMPLATE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +34,11 @@ class RefinementAgent:
             model_tier: LLM tier to use (primary/research/validation)
             temperature: Temperature for generation
         """
-        self.llm = create_llm(tier=model_tier, temperature=temperature)
+        self.llm = create_llm(
+            tier=model_tier,
+            temperature=temperature,
+            cache_key="braze-refinement"
+        )
 
     def process(self, state: CodeGenerationState, config: RunnableConfig) -> dict:
         """Refine generated code to fix validation issues.
@@ -66,18 +73,21 @@ Features implemented: {', '.join(generated_code.features_implemented)}
 Braze SDK initialized: {generated_code.braze_sdk_initialized}
 """
 
-        # Create refinement prompt
-        prompt = REFINEMENT_AGENT_PROMPT.format(
+        # Build the per-iteration brief (everything dynamic goes here so the
+        # system prompt stays identical across refinement iterations)
+        brief = REFINEMENT_BRIEF_TEMPLATE.format(
             original_code_summary=original_code_summary,
             validation_issues=self._format_validation_issues(validation_report),
-            issues_to_fix=issues_to_fix
+            issues_to_fix=issues_to_fix,
+            html=generated_code.html
         )
 
         try:
-            messages = [
-                SystemMessage(content=prompt),
-                HumanMessage(content=f"Fix the validation issues in this HTML:\n\n{generated_code.html}")
-            ]
+            messages = build_messages(
+                static_system=REFINEMENT_AGENT_PROMPT,
+                static_reference_blocks=[],
+                dynamic_user=brief
+            )
 
             # Pass config to LLM invoke for token streaming callbacks
             response = self.llm.invoke(messages, config=config)
@@ -6,17 +6,60 @@ across OpenAI, Anthropic, and Google providers using LangChain abstractions.
 
 import logging
 import os
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Optional
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
+import httpx
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from braze_code_gen.core.models import LLMConfig, ModelProvider, ModelTier
 
+# Provider integrations are imported inside the matching _create_*_llm method
+# so only the configured provider's SDK is loaded (anthropic alone is ~1s).
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_openai import ChatOpenAI
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool size for the shared OpenAI HTTP client
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Same defaults the openai SDK applies to its own client
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(timeout=600.0, connect=5.0)
+
+# Shared OpenAI HTTP client (lazy loaded, see _get_openai_http_client)
+_openai_http_client: Optional[httpx.Client] = None
+_openai_http_client_lock = threading.Lock()
+
+
+def _get_openai_http_client() -> httpx.Client:
+    """Get the HTTP client shared by every ChatOpenAI instance.
+
+    Each agent owns its own ChatOpenAI, and by default each one opens its own
+    connection pool. Sharing one HTTP/2 client lets consecutive agent calls
+    reuse the same TLS connection instead of handshaking per agent.
+
+    Returns:
+        httpx.Client: Shared client with OpenAI's default timeouts
+    """
+    global _openai_http_client
+
+    if _openai_http_client is None:
+        with _openai_http_client_lock:
+            if _openai_http_client is None:
+                _openai_http_client = httpx.Client(
+                    http2=True,
+                    timeout=OPENAI_HTTP_TIMEOUT,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                    )
+                )
+
+    return _openai_http_client
+
 
 class LLMFactory:
     """Factory for creating LLM instances with provider abstraction."""
@@ -75,6 +118,7 @@ class LLMFactory:
         self,
         tier: ModelTier,
         temperature: float,
+        cache_key: Optional[str] = None,
         **kwargs
     ) -> BaseChatModel:
         """Create LLM instance for given tier and temperature.
@@ -82,6 +126,9 @@ class LLMFactory:
         Args:
             tier: Model tier (primary/research/validation)
             temperature: Temperature for generation (0.0-1.0)
+            cache_key: Optional prompt cache routing key. Sent as OpenAI's
+                prompt_cache_key so calls sharing a static prefix land on the
+                same cache; ignored by other providers.
             **kwargs: Additional provider-specific arguments
 
         Returns:
@@ -99,6 +146,13 @@ class LLMFactory:
         )
 
         if provider == ModelProvider.OPENAI:
+            if cache_key:
+                # Sent via extra_body so openai SDKs predating the
+                # prompt_cache_key argument still accept the request
+                kwargs["extra_body"] = {
+                    "prompt_cache_key": cache_key,
+                    **kwargs.get("extra_body", {})
+                }
             return self._create_openai_llm(model_name, temperature, **kwargs)
         elif provider == ModelProvider.ANTHROPIC:
             return self._create_anthropic_llm(model_name, temperature, **kwargs)
@@ -112,7 +166,7 @@ class LLMFactory:
         model: str,
         temperature: float,
         **kwargs
-    ) -> ChatOpenAI:
+    ) -> "ChatOpenAI":
         """Create OpenAI LLM instance.
 
         Args:
@@ -123,6 +177,10 @@ class LLMFactory:
         Returns:
             ChatOpenAI: OpenAI chat model instance
         """
+        from langchain_openai import ChatOpenAI
+
+        kwargs.setdefault("http_client", _get_openai_http_client())
+
         return ChatOpenAI(
             model=model,
             temperature=temperature,
@@ -136,7 +194,7 @@ class LLMFactory:
         model: str,
         temperature: float,
         **kwargs
-    ) -> ChatAnthropic:
+    ) -> "ChatAnthropic":
         """Create Anthropic LLM instance.
 
         Args:
@@ -147,6 +205,8 @@ class LLMFactory:
         Returns:
             ChatAnthropic: Anthropic chat model instance
         """
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model=model,
             temperature=temperature,
@@ -160,7 +220,7 @@ class LLMFactory:
         model: str,
         temperature: float,
         **kwargs
-    ) -> ChatGoogleGenerativeAI:
+    ) -> "ChatGoogleGenerativeAI":
         """Create Google LLM instance.
 
         Args:
@@ -171,6 +231,8 @@ class LLMFactory:
         Returns:
             ChatGoogleGenerativeAI: Google chat model instance
         """
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         return ChatGoogleGenerativeAI(
             model=model,
             temperature=temperature,
@@ -201,7 +263,12 @@ def get_llm_factory() -> LLMFactory:
     return _factory_instance
 
 
-def create_llm(tier: ModelTier, temperature: float, **kwargs) -> BaseChatModel:
+def create_llm(
+    tier: ModelTier,
+    temperature: float,
+    cache_key: Optional[str] = None,
+    **kwargs
+) -> BaseChatModel:
     """Convenience function to create LLM without directly using factory.
 
     This is the recommended way to create LLM instances in agents.
@@ -209,6 +276,7 @@ def create_llm(tier: ModelTier, temperature: float, **kwargs) -> BaseChatModel:
     Args:
         tier: Model tier (primary/research/validation)
         temperature: Temperature for generation
+        cache_key: Optional prompt cache routing key (OpenAI only)
         **kwargs: Additional provider-specific arguments
 
     Returns:
@@ -220,4 +288,4 @@ def create_llm(tier: ModelTier, temperature: float, **kwargs) -> BaseChatModel:
         >>> llm = create_llm(tier=ModelTier.PRIMARY, temperature=0.7)
     """
     factory = get_llm_factory()
-    return factory.create_llm(tier, temperature, **kwargs)
+    return factory.create_llm(tier, temperature, cache_key=cache_key, **kwargs)
@@ -161,31 +161,8 @@ CODE_GENERATION_AGENT_PROMPT = """You are the Code Generation Agent for the Braz
 
 Your role is to generate a complete, functional HTML landing page with Braze SDK integration using modern JavaScript.
 
-## Feature Plan
-
-{feature_plan}
-
-## Research Results
-
-{research_summary}
-
-## Customer Branding
-
-**Colors**: Primary={primary_color}, Accent={accent_color}
-**Fonts**: Primary={primary_font}, Heading={heading_font}
-
-## Base Template
-
-You will build upon this base template:
-
-{base_template}
-
-## SDK Implementation Reference
-
-The following patterns show correct Braze Web SDK usage.
-Use these as authoritative reference for method signatures and patterns:
-
-{sdk_reference_examples}
+The feature plan, research results, customer branding and the base template you
+will build upon are provided in the user message.
 
 ## Your Task
 
@@ -201,20 +178,20 @@ Generate a complete HTML file that:
    -Do not add in console alert functions
    - Example structure:
      ```javascript
-     window.AppName = (function() {{
-         const utils = {{ /* helper functions */ }};
-         const components = {{ /* reusable UI builders */ }};
-         const sections = {{ /* page sections */ }};
-         const handlers = {{ /* event management */ }};
+     window.AppName = (function() {
+         const utils = { /* helper functions */ };
+         const components = { /* reusable UI builders */ };
+         const sections = { /* page sections */ };
+         const handlers = { /* event management */ };
 
-         function init() {{
+         function init() {
              // Render all content dynamically
              document.getElementById('app').innerHTML = /* generated HTML */;
              // Setup event handlers
-         }}
+         }
 
-         return {{ init }};
-     }})();
+         return { init };
+     })();
      ```
 
 2. **Uses Customer Branding with Modern Design**:
@@ -256,37 +233,37 @@ Generate a complete HTML file that:
 Use this pattern for building UI components:
 
 ```javascript
-const components = {{
-    button(config) {{
-        const {{ text, id, className = 'btn-primary' }} = config;
-        return `<button id="${{id}}" class="btn ${{className}}">${{text}}</button>`;
-    }},
-
-    formGroup(config) {{
-        const {{ label, id, type = 'text', placeholder = '' }} = config;
+const components = {
+    button(config) {
+        const { text, id, className = 'btn-primary' } = config;
+        return `<button id="${id}" class="btn ${className}">${text}</button>`;
+    },
+
+    formGroup(config) {
+        const { label, id, type = 'text', placeholder = '' } = config;
         return `
             <div class="form-group">
-                <label class="form-label">${{label}}</label>
-                <input type="${{type}}" id="${{id}}" class="form-input"
-                       placeholder="${{placeholder}}">
+                <label class="form-label">${label}</label>
+                <input type="${type}" id="${id}" class="form-input"
+                       placeholder="${placeholder}">
             </div>
         `;
-    }},
+    },
 
-    sectionCard(config) {{
-        const {{ icon, title, description, content }} = config;
+    sectionCard(config) {
+        const { icon, title, description, content } = config;
         return `
             <div class="section-card">
                 <div class="section-header">
-                    <div class="section-icon">${{icon}}</div>
-                    <h2 class="section-title">${{title}}</h2>
+                    <div class="section-icon">${icon}</div>
+                    <h2 class="section-title">${title}</h2>
                 </div>
-                <p class="section-description">${{description}}</p>
-                ${{content}}
+                <p class="section-description">${description}</p>
+                ${content}
             </div>
         `;
-    }}
-}};
+    }
+};
 ```
 
 ## Code Quality Requirements
@@ -306,6 +283,28 @@ The output should start with `<!DOCTYPE html>` and be a valid, complete HTML doc
 All CSS should be in a <style> block, all JavaScript should be in <script> blocks.
 """
 
+CODE_GENERATION_AGENT_REFERENCE_HEADER = """## SDK Implementation Reference
+
+The following patterns show correct Braze Web SDK usage.
+Use these as authoritative reference for method signatures and patterns:
+"""
+
+CODE_GENERATION_BRIEF_TEMPLATE = """## Feature Plan
+
+{feature_plan}
+
+## Customer Branding
+
+**Colors**: Primary={primary_color}, Accent={accent_color}
+**Fonts**: Primary={primary_font}, Heading={heading_font}
+
+## Base Template
+
+Generate the complete HTML landing page, building upon this base template:
+
+{base_template}
+"""
+
 # ============================================================================
 # Validation Agent Prompt
 # ============================================================================
@@ -374,17 +373,8 @@ REFINEMENT_AGENT_PROMPT = """You are the Refinement Agent for the Braze SDK Land
 
 Your role is to fix issues identified during validation.
 
-## Original Code
-
-{original_code_summary}
-
-## Validation Issues
-
-{validation_issues}
-
-## Specific Problems to Fix
-
-{issues_to_fix}
+The user message contains a summary of the original code, the validation
+results, the specific problems to fix, and the HTML to fix.
 
 ## Your Task
 
@@ -411,6 +401,23 @@ The output should start with `<!DOCTYPE html>` and be a valid, complete HTML doc
 Make only the necessary changes to fix the issues. Do not refactor working code.
 """
 
+REFINEMENT_BRIEF_TEMPLATE = """## Original Code
+
+{original_code_summary}
+
+## Validation Issues
+
+{validation_issues}
+
+## Specific Problems to Fix
+
+{issues_to_fix}
+
+## HTML to Fix
+
+{html}
+"""
+
 # ============================================================================
 # Finalization Agent Prompt
 # ============================================================================
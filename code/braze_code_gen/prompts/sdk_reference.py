@@ -5,6 +5,9 @@ the Braze Web SDK Integration Guide. These serve as reference examples to
 guide the code generation agent in producing correct SDK integrations.
 """
 
+import re
+from typing import List, Tuple
+
 SDK_REFERENCE_EXAMPLES = """
 **CRITICAL INSTRUCTION**: The base template already includes SDK initialization with the
 ACTUAL API key and SDK endpoint from the user's Braze configuration. DO NOT copy the
@@ -336,3 +339,94 @@ braze.subscribeToSdkAuthenticationFailures(function(event) {
 });
 ```
 """
+
+
+# ============================================================================
+# Per-section blocks
+# ============================================================================
+
+_SECTION_RE = re.compile(r"^### ", re.MULTILINE)
+
+
+def _split_reference(text: str) -> List[Tuple[str, str]]:
+    """Split the reference string into (section_title, section_text) blocks.
+
+    Args:
+        text: Reference text with ``### `` section headings
+
+    Returns:
+        List[Tuple[str, str]]: One entry per section, in document order
+    """
+    blocks = []
+    for chunk in _SECTION_RE.split(text)[1:]:
+        title = chunk.partition("\n")[0].strip()
+        blocks.append((title, f"### {chunk}".strip()))
+    return blocks
+
+
+SDK_REFERENCE_BLOCKS: List[Tuple[str, str]] = _split_reference(SDK_REFERENCE_EXAMPLES)
+
+
+# ============================================================================
+# Local lookup
+# ============================================================================
+
+# Splits identifiers like "logCustomEvent" into log/custom/event
+_TOKEN_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+# Words that carry no signal for picking a section (every section is Braze Web SDK)
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "braze", "can", "do", "does", "for", "how", "i",
+    "in", "is", "it", "javascript", "js", "my", "of", "on", "or", "sdk", "the",
+    "to", "use", "using", "web", "what", "with",
+})
+
+# Minimum fraction of query tokens that must appear in a section for a hit
+LOCAL_LOOKUP_MIN_SCORE = 0.75
+
+
+def _tokenize(text: str) -> frozenset:
+    """Tokenize text into a set of lower-cased, de-pluralized words."""
+    tokens = set()
+    for token in _TOKEN_RE.findall(text):
+        token = token.lower()
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+_REFERENCE_INDEX: List[Tuple[frozenset, str, frozenset]] = [
+    (_tokenize(title), text, _tokenize(text)) for title, text in SDK_REFERENCE_BLOCKS
+]
+
+
+def local_reference_lookup(query: str, k: int = 3) -> List[str]:
+    """Answer a documentation query from the bundled SDK reference sections.
+
+    Each section is scored by the fraction of (non-stopword) query tokens it
+    contains, with ties broken by overlap with the section title. Query strings
+    are short compared to sections, so plain Jaccard similarity would penalize
+    every section for its length.
+
+    Args:
+        query: Documentation search query
+        k: Maximum number of sections to return
+
+    Returns:
+        List[str]: Up to ``k`` matching section texts, best first; empty on a miss
+    """
+    query_tokens = _tokenize(query)
+    if not query_tokens:
+        return []
+
+    scored = []
+    for title_tokens, text, tokens in _REFERENCE_INDEX:
+        score = len(query_tokens & tokens) / len(query_tokens)
+        if score >= LOCAL_LOOKUP_MIN_SCORE:
+            scored.append((score, len(query_tokens & title_tokens), text))
+
+    scored.sort(key=lambda item: item[:2], reverse=True)
+    return [text for _score, _title_overlap, text in scored[:k]]
@@ -0,0 +1,13 @@
+"""Shared pytest fixtures for the Braze Code Generator tests."""
+
+import pytest
+
+from braze_code_gen.tools import mcp_client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start and end every test with an empty MCP result cache."""
+    mcp_client.clear_mcp_cache()
+    yield
+    mcp_client.clear_mcp_cache()
@@ -0,0 +1,114 @@
+"""Unit tests for the MCP client result cache and in-flight coalescing.
+
+The MCP session is stubbed, so these tests never start the Braze MCP server.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from braze_code_gen.tools import mcp_client
+
+N_CALLERS = 8
+
+
+class _CountingDict(dict):
+    """In-flight map that signals once every caller has looked up its key."""
+
+    def __init__(self, expected_lookups: int):
+        super().__init__()
+        self.expected_lookups = expected_lookups
+        self.lookups = 0
+        self.all_joined = threading.Event()
+
+    def get(self, key, default=None):
+        self.lookups += 1  # Only called under _MCP_INFLIGHT_LOCK
+        if self.lookups >= self.expected_lookups:
+            self.all_joined.set()
+        return super().get(key, default)
+
+
+@pytest.fixture
+def inflight():
+    """Replace the in-flight map with one that counts lookups."""
+    counting = _CountingDict(expected_lookups=N_CALLERS)
+    with patch.object(mcp_client, "_MCP_INFLIGHT", counting):
+        yield counting
+
+
+def _run_concurrently(func):
+    """Call func from N_CALLERS threads, returning results or exceptions."""
+    def call(_):
+        try:
+            return func()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=N_CALLERS) as executor:
+        return list(executor.map(call, range(N_CALLERS)))
+
+
+class TestInflightCoalescing:
+    """Test suite for coalescing concurrent identical MCP calls."""
+
+    def test_concurrent_identical_calls_make_one_request(self, inflight):
+        """Test that N concurrent identical calls reach the session once."""
+        session_calls = []
+
+        def fake_call(operation_name, coro_func, total_timeout=30.0):
+            session_calls.append(operation_name)
+            assert inflight.all_joined.wait(timeout=5)
+            return {"success": True, "content": "custom_event schema"}
+
+        with patch.object(mcp_client._mcp_session, "call", side_effect=fake_call):
+            results = _run_concurrently(lambda: mcp_client.run_mcp_get_event_schema("custom_event"))
+
+        assert session_calls == ["get_event_schema"]
+        assert results == ["custom_event schema"] * N_CALLERS
+        assert dict(inflight) == {}
+
+    def test_exception_reaches_every_joined_caller(self, inflight):
+        """Test that a failed call raises in every caller and is not cached."""
+        session_calls = []
+
+        def fake_call(operation_name, coro_func, total_timeout=30.0):
+            session_calls.append(operation_name)
+            assert inflight.all_joined.wait(timeout=5)
+            raise TimeoutError("MCP get_event_schema timed out")
+
+        with patch.object(mcp_client._mcp_session, "call", side_effect=fake_call):
+            results = _run_concurrently(lambda: mcp_client.run_mcp_get_event_schema("purchase"))
+
+        assert session_calls == ["get_event_schema"]
+        assert all(isinstance(r, TimeoutError) for r in results)
+        assert dict(inflight) == {}
+        assert len(mcp_client._MCP_RESULT_CACHE) == 0
+
+
+class TestResultCache:
+    """Test suite for the MCP result cache."""
+
+    def test_successful_result_is_cached(self):
+        """Test that a real result is served from the cache on repeat calls."""
+        with patch.object(
+            mcp_client._mcp_session, "call",
+            return_value={"success": True, "content": "checklist"}
+        ) as mock_call:
+            assert mcp_client.run_mcp_get_setup_checklist("dev") == "checklist"
+            assert mcp_client.run_mcp_get_setup_checklist(environment="dev") == "checklist"
+
+        assert mock_call.call_count == 1
+
+    def test_unsuccessful_result_is_not_cached(self):
+        """Test that not-found and tool-error replies are returned but not cached."""
+        with patch.object(
+            mcp_client._mcp_session, "call",
+            return_value={"success": False, "content": "Schema not found"}
+        ) as mock_call:
+            assert mcp_client.run_mcp_get_event_schema("unknown") == "Schema not found"
+            assert mcp_client.run_mcp_get_event_schema("unknown") == "Schema not found"
+
+        assert mock_call.call_count == 2
+        assert len(mcp_client._MCP_RESULT_CACHE) == 0
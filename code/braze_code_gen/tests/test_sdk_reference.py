@@ -0,0 +1,63 @@
+"""Unit tests for the local SDK reference lookup used before MCP search."""
+
+from unittest.mock import patch
+
+import pytest
+
+from braze_code_gen.prompts.sdk_reference import local_reference_lookup
+from braze_code_gen.tools import mcp_client
+
+
+def _title(section: str) -> str:
+    """Return the heading of a reference section."""
+    return section.partition("\n")[0].removeprefix("### ")
+
+
+class TestLocalReferenceLookup:
+    """Test suite for local_reference_lookup scoring."""
+
+    @pytest.mark.parametrize("query, expected_title", [
+        ("how do I log a custom event", "Custom Events"),
+        ("changeUser", "User Identification"),
+    ])
+    def test_common_queries_hit(self, query, expected_title):
+        """Test that common SDK questions resolve to the right section first."""
+        results = local_reference_lookup(query)
+
+        assert results
+        assert _title(results[0]) == expected_title
+
+    def test_unrelated_query_misses(self):
+        """Test that a query the reference does not cover returns nothing."""
+        assert local_reference_lookup("set up push notifications on iOS with Firebase") == []
+
+    def test_stopword_only_query_misses(self):
+        """Test that a query with no meaningful tokens returns nothing."""
+        assert local_reference_lookup("how do I use the Braze Web SDK") == []
+
+    def test_results_respect_k(self):
+        """Test that at most k sections are returned."""
+        assert len(local_reference_lookup("how do I log a custom event", k=1)) == 1
+
+
+class TestSearchFallthrough:
+    """Test suite for run_mcp_search's local-then-MCP routing."""
+
+    def test_local_hit_skips_mcp(self):
+        """Test that a local hit is answered without calling the MCP server."""
+        with patch.object(mcp_client._mcp_session, "call") as mock_call:
+            result = mcp_client.run_mcp_search("changeUser")
+
+        mock_call.assert_not_called()
+        assert "User Identification" in result
+
+    def test_local_miss_falls_through_to_mcp(self):
+        """Test that a local miss is sent to the MCP server."""
+        with patch.object(
+            mcp_client._mcp_session, "call",
+            return_value={"success": True, "content": "iOS push docs"}
+        ) as mock_call:
+            result = mcp_client.run_mcp_search("set up push notifications on iOS with Firebase")
+
+        mock_call.assert_called_once()
+        assert result == "iOS push docs"
@@ -0,0 +1,277 @@
+"""Unit tests for the website analyzer's fetching, caching and extraction.
+
+The requests sessions are stubbed, so these tests never touch the network.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from selectolax.lexbor import LexborHTMLParser
+
+from braze_code_gen.tools import website_analyzer
+from braze_code_gen.tools.website_analyzer import (
+    WebsiteAnalyzer,
+    _font_families_from_css,
+    _is_retryable_status,
+)
+
+URL = "https://example.com"
+
+PAGE = (
+    "<html><head><style>"
+    ".a { color: #FF0000; font-family: 'Brand Sans', sans-serif }"
+    ".b { color: #00FF00 } .c { color: #0000FF }"
+    "</style></head><body></body></html>"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_css_cache():
+    """Start and end every test with an empty stylesheet cache."""
+    website_analyzer._CSS_CACHE.clear()
+    yield
+    website_analyzer._CSS_CACHE.clear()
+
+
+@pytest.fixture
+def analyzer():
+    """Create a website analyzer with stubbed sessions and no backoff sleeps."""
+    analyzer = WebsiteAnalyzer(max_retries=3)
+    with patch.object(analyzer, "_session"), \
+            patch.object(analyzer, "_insecure_session"), \
+            patch.object(website_analyzer.time, "sleep"):
+        yield analyzer
+
+
+def _response(body=b"", status=200, headers=None, encoding="utf-8"):
+    """Build a streamed response stub as returned by session.get()."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = headers or {}
+    response.encoding = encoding
+    response.raw.read.side_effect = lambda n, decode_content=True: body[:n]
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            response=MagicMock(status_code=status)
+        )
+    return response
+
+
+def _extract_colors(analyzer, html, css_contents=()):
+    """Run color extraction on an HTML page and optional linked stylesheets."""
+    sources = analyzer._collect_style_sources(LexborHTMLParser(html), URL)
+    return analyzer._extract_colors(sources, list(css_contents))
+
+
+class TestColorExtraction:
+    """Test suite for color extraction."""
+
+    def test_body_text_hex_is_ignored(self, analyzer):
+        """Test that hex-looking words in body text are not counted as colors."""
+        html = (
+            "<html><head><style>"
+            ".a { color: #FF0000 } .b { color: #00FF00 } .c { color: #0000FF }"
+            "</style></head><body>"
+            + "<p>Order #ADDBAD ships with code #CAFE99 and tag #BEEF</p>" * 20
+            + "</body></html>"
+        )
+
+        colors = _extract_colors(analyzer, html)
+
+        assert {colors.primary, colors.secondary, colors.accent} == {"#FF0000", "#00FF00", "#0000FF"}
+
+    def test_body_text_only_page_has_no_colors(self, analyzer):
+        """Test that a page whose only hex strings are in body text yields no colors."""
+        html = "<html><body><p>Tickets #ADDBAD, #CAFE99 and #BEEF are closed</p></body></html>"
+
+        assert _extract_colors(analyzer, html) is None
+
+    def test_alpha_hex_colors_are_counted(self, analyzer):
+        """Test that #RRGGBBAA and #RGBA colors count toward their opaque color."""
+        html = (
+            '<html><body style="color: #FF000080">'
+            '<div style="background: #0F08">'
+            '<span style="border-color: #123456">x</span>'
+            "</div></body></html>"
+        )
+
+        colors = _extract_colors(analyzer, html)
+
+        assert {colors.primary, colors.secondary, colors.accent} == {"#FF0000", "#00FF00", "#123456"}
+
+    def test_linked_stylesheets_are_counted(self, analyzer):
+        """Test that colors from fetched stylesheets are combined with inline ones."""
+        html = '<html><body style="color: #FF0000"></body></html>'
+        css = ".a { color: rgb(0, 255, 0) } .b { color: #00f }"
+
+        colors = _extract_colors(analyzer, html, [css, None])
+
+        assert {colors.primary, colors.secondary, colors.accent} == {"#FF0000", "#00FF00", "#0000FF"}
+
+
+class TestStyleSources:
+    """Test suite for the single-pass style source collection."""
+
+    def test_collects_every_style_source(self, analyzer):
+        """Test that inline styles, style blocks and links are sorted by kind."""
+        html = (
+            "<html><head>"
+            '<link rel="stylesheet" href="/css/site.css">'
+            '<link rel="icon" href="/favicon.ico">'
+            '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Open+Sans">'
+            "<style>.a { color: red }</style>"
+            '</head><body style="margin: 0"><p style="color: blue">x</p></body></html>'
+        )
+
+        sources = analyzer._collect_style_sources(LexborHTMLParser(html), URL)
+
+        assert sources.inline_styles == ["margin: 0", "color: blue"]
+        assert sources.style_blocks == [".a { color: red }"]
+        assert sources.stylesheet_urls == [
+            "https://example.com/css/site.css",
+            "https://fonts.googleapis.com/css2?family=Open+Sans",
+        ]
+        assert sources.font_links == ["https://fonts.googleapis.com/css2?family=Open+Sans"]
+
+
+class TestFontFamilies:
+    """Test suite for tinycss2 font-family collection."""
+
+    def test_nested_and_multiline_declarations(self):
+        """Test that @media, @font-face and multi-line values are all found."""
+        css = """
+            body {
+                font-family: "Brand Sans",
+                    Helvetica, sans-serif;
+            }
+            @media (min-width: 600px) { h1 { font-family: Georgia, serif } }
+            @font-face { font-family: "Brand Display"; src: url(brand.woff2) }
+            .x { font-family: var(--font-body) }
+        """
+
+        families = _font_families_from_css(css)
+
+        assert len(families) == 3
+        assert families[0].startswith('"Brand Sans"')
+        assert families[1:] == ["Georgia, serif", '"Brand Display"']
+
+    def test_inline_declarations(self):
+        """Test that a style attribute value is parsed as a declaration list."""
+        assert _font_families_from_css("color: red; font-family: Inter", inline=True) == ["Inter"]
+
+    def test_typography_uses_first_non_generic_font(self, analyzer):
+        """Test that the extracted primary font skips generic families."""
+        sources = analyzer._collect_style_sources(LexborHTMLParser(PAGE), URL)
+
+        typography = analyzer._extract_typography(sources)
+
+        assert typography.primary_font == "'Brand Sans', sans-serif"
+
+
+class TestGetCapped:
+    """Test suite for the size-capped body read."""
+
+    def test_body_is_truncated_at_max_bytes(self, analyzer):
+        """Test that at most max_bytes of the body are read."""
+        analyzer.max_bytes = 10
+        analyzer._session.get.return_value = _response(b"x" * 100, headers={"Content-Length": "100"})
+
+        body = analyzer._get_capped(analyzer._session, URL, {}, 5)
+
+        assert body == "x" * 10
+        analyzer._session.get.return_value.raw.read.assert_called_once_with(10, decode_content=True)
+
+    def test_body_is_decoded_with_response_charset(self, analyzer):
+        """Test that the response encoding is used to decode the body."""
+        analyzer._session.get.return_value = _response("café".encode("latin-1"), encoding="latin-1")
+
+        assert analyzer._get_capped(analyzer._session, URL, {}, 5) == "café"
+
+
+class TestRetryClassification:
+    """Test suite for deciding which fetch failures are retried."""
+
+    @pytest.mark.parametrize("status_code, retryable", [
+        (500, True),
+        (503, True),
+        (429, True),
+        (404, False),
+        (403, False),
+        (None, False),
+    ])
+    def test_is_retryable_status(self, status_code, retryable):
+        """Test that only 5xx and 429 are treated as transient."""
+        assert _is_retryable_status(status_code) is retryable
+
+    def test_server_error_is_retried(self, analyzer):
+        """Test that a 503 is retried and a later success is returned."""
+        analyzer._session.get.side_effect = [_response(status=503), _response(b"<html></html>")]
+
+        assert analyzer._fetch_website(URL) == "<html></html>"
+        assert analyzer._session.get.call_count == 2
+
+    def test_client_error_is_not_retried(self, analyzer):
+        """Test that a 404 gives up after one attempt."""
+        analyzer._session.get.return_value = _response(status=404)
+
+        assert analyzer._fetch_website(URL) is None
+        assert analyzer._session.get.call_count == 1
+
+    def test_timeout_is_retried_up_to_max_retries(self, analyzer):
+        """Test that timeouts are retried until max_retries is reached."""
+        analyzer._session.get.side_effect = requests.Timeout()
+
+        assert analyzer._fetch_website(URL) is None
+        assert analyzer._session.get.call_count == analyzer.max_retries
+
+    def test_ssl_error_falls_back_to_unverified_session(self, analyzer):
+        """Test that an SSL failure skips retries and uses the unverified session."""
+        analyzer._session.get.side_effect = requests.exceptions.SSLError()
+        analyzer._insecure_session.get.return_value = _response(b"<html></html>")
+
+        assert analyzer._fetch_website(URL) == "<html></html>"
+        assert analyzer._session.get.call_count == 1
+        assert analyzer._insecure_session.get.call_count == 1
+
+
+class TestCaching:
+    """Test suite for the stylesheet and analysis result caches."""
+
+    def test_stylesheet_is_fetched_once_across_analyzers(self, analyzer):
+        """Test that the shared CSS cache serves repeat fetches of a URL."""
+        analyzer._session.get.return_value = _response(b".a { color: red }")
+        other = WebsiteAnalyzer()
+
+        with patch.object(other, "_session") as other_session:
+            assert analyzer._fetch_css(f"{URL}/site.css") == ".a { color: red }"
+            assert other._fetch_css(f"{URL}/site.css") == ".a { color: red }"
+
+        assert analyzer._session.get.call_count == 1
+        other_session.get.assert_not_called()
+
+    def test_failed_stylesheet_is_not_cached(self, analyzer):
+        """Test that a failed CSS fetch is retried on the next call."""
+        analyzer._session.get.side_effect = requests.ConnectionError()
+
+        assert analyzer._fetch_css(f"{URL}/site.css") is None
+        assert analyzer._fetch_css(f"{URL}/site.css") is None
+        assert analyzer._session.get.call_count == 2
+
+    def test_result_is_cached_by_normalized_url(self, analyzer):
+        """Test that repeat analyses of the same site reuse the first result."""
+        with patch.object(analyzer, "_fetch_website", return_value=PAGE) as mock_fetch:
+            first = analyzer.analyze_website("example.com")
+            second = analyzer.analyze_website("https://example.com/")
+
+        assert first.extraction_success
+        assert second is first
+        mock_fetch.assert_called_once()
+
+    def test_fallback_result_is_not_cached(self, analyzer):
+        """Test that fallback branding from a failed fetch is not cached."""
+        with patch.object(analyzer, "_fetch_website", return_value=None) as mock_fetch:
+            assert analyzer.analyze_website(URL).fallback_used
+            assert analyzer.analyze_website(URL).fallback_used
+
+        assert mock_fetch.call_count == 2
@@ -3,19 +3,22 @@
 This module provides functionality to test generated landing pages in a headless browser.
 """
 
+import importlib.util
 import logging
 import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
 
-try:
-    from playwright.sync_api import sync_playwright, Page, Browser
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Probe for Playwright without importing it; the driver is only loaded when a
+# browser session is actually started.
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+if not PLAYWRIGHT_AVAILABLE:
     logging.warning("Playwright not available. Install with: pip install playwright && playwright install")
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 from braze_code_gen.core.models import ValidationReport, ValidationIssue
 
 logger = logging.getLogger(__name__)
@@ -68,6 +71,8 @@ class BrowserTester:
         screenshots: List[str] = []
         braze_sdk_loaded = False
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             # Launch browser
             browser = p.chromium.launch(headless=self.headless)
@@ -146,7 +151,7 @@ class BrowserTester:
             test_timestamp=datetime.now().isoformat()
         )
 
-    def _check_braze_sdk(self, page: Page) -> bool:
+    def _check_braze_sdk(self, page: "Page") -> bool:
         """Check if Braze SDK is loaded.
 
         Args:
@@ -163,7 +168,7 @@ class BrowserTester:
             logger.warning(f"Error checking Braze SDK: {e}")
             return False
 
-    def _validate_html_structure(self, page: Page) -> List[ValidationIssue]:
+    def _validate_html_structure(self, page: "Page") -> List[ValidationIssue]:
         """Validate HTML structure.
 
         Args:
@@ -217,7 +222,7 @@ class BrowserTester:
 
         return issues
 
-    def _validate_braze_sdk_init(self, page: Page) -> List[ValidationIssue]:
+    def _validate_braze_sdk_init(self, page: "Page") -> List[ValidationIssue]:
         """Validate Braze SDK initialization.
 
         Args:
@@ -269,7 +274,7 @@ class BrowserTester:
 
         return issues
 
-    def _take_screenshot(self, page: Page) -> Optional[str]:
+    def _take_screenshot(self, page: "Page") -> Optional[str]:
         """Take screenshot of page.
 
         Args:
@@ -310,6 +315,8 @@ class BrowserTester:
         """
         issues = []
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=self.headless)
             page = browser.new_page()
@@ -6,9 +6,14 @@ to Braze documentation.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
+import inspect
 import json
 import logging
 import random
+import shutil
 import threading
 import time
 from contextlib import asynccontextmanager
@@ -17,6 +22,9 @@ from typing import Any, Optional
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from braze_code_gen.prompts.sdk_reference import local_reference_lookup
+from braze_code_gen.utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
@@ -33,9 +41,65 @@ DEFAULT_SERVER_PATH = "/Users/Jacob.Jaffe/code-gen-agent/braze-docs-mcp"
 DEFAULT_PYTHON_PATH = f"{DEFAULT_SERVER_PATH}/venv/bin/python"
 DEFAULT_SERVER_SCRIPT = f"{DEFAULT_SERVER_PATH}/server.py"
 
-# Global lock to serialize MCP connections and avoid race conditions
-# when multiple tools are called concurrently
-_connection_lock = threading.Lock()
+# Results of identical MCP calls (agents repeat the same searches across turns).
+# Entries expire so long-running sessions eventually see updated docs.
+_MCP_RESULT_CACHE = TTLCache(maxsize=512, ttl=600)
+
+# Calls currently running, by cache key. A duplicate call that arrives while
+# the first is still in flight (ToolNode runs a turn's tool calls in parallel)
+# waits for that call's result instead of issuing its own request.
+_MCP_INFLIGHT: "dict[tuple, concurrent.futures.Future]" = {}
+_MCP_INFLIGHT_LOCK = threading.Lock()
+
+# Local reference lookup statistics (for cache-hit ratio logging)
+_local_lookup_hits = 0
+_local_lookup_total = 0
+
+
+class _MCPNoResult(Exception):
+    """An MCP call completed without a usable result (not found or tool error).
+
+    Raised by the run_mcp_* wrappers after the session call returns, so the
+    retry loop never sees it. _cache_result returns its message to the caller
+    without caching it.
+    """
+
+
+def _tool_result_to_dict(result: Any, not_found: str) -> dict:
+    """Convert an MCP CallToolResult into a {"success", "content"} dict.
+
+    Args:
+        result: CallToolResult returned by ClientSession.call_tool
+        not_found: Content to report when the result has no text block
+
+    Returns:
+        dict: ``success`` is False for tool errors and empty results
+    """
+    # Newer mcp releases name the flag is_error, older ones isError
+    is_error = getattr(result, "is_error", None) or getattr(result, "isError", False)
+
+    for content_block in result.content or []:
+        if hasattr(content_block, 'text'):
+            return {"success": not is_error, "content": content_block.text}
+
+    return {"success": False, "content": not_found}
+
+
+def _result_content(result: dict) -> str:
+    """Return the content of a successful tool result dict.
+
+    Args:
+        result: Dict from _tool_result_to_dict
+
+    Returns:
+        str: Result content
+
+    Raises:
+        _MCPNoResult: If the tool reported an error or found nothing
+    """
+    if not result["success"]:
+        raise _MCPNoResult(result["content"])
+    return result["content"]
 
 
 class BrazeMCPClient:
@@ -60,6 +124,9 @@ class BrazeMCPClient:
         Args:
             server_command: Path to MCP server command (default: official braze-docs-mcp)
             use_official_server: If True, use official Braze MCP server; if False, use custom server
+
+        Raises:
+            FileNotFoundError: If the server command is not an executable file or on PATH
         """
         if use_official_server:
             self.server_command = server_command or DEFAULT_SERVER_COMMAND
@@ -69,6 +136,17 @@ class BrazeMCPClient:
             self.server_command = DEFAULT_PYTHON_PATH
             self.server_args = [DEFAULT_SERVER_SCRIPT]
 
+        # Validate once here instead of failing deep inside stdio_client
+        if shutil.which(self.server_command) is None:
+            raise FileNotFoundError(
+                f"Braze MCP server command not found or not executable: {self.server_command}"
+            )
+
+        self._server_params = StdioServerParameters(
+            command=self.server_command,
+            args=self.server_args,
+        )
+
         self._session: Optional[ClientSession] = None
         self._read_stream = None
         self._write_stream = None
@@ -80,14 +158,9 @@ class BrazeMCPClient:
         Yields:
             BrazeMCPClient: Connected client instance
         """
-        server_params = StdioServerParameters(
-            command=self.server_command,
-            args=self.server_args,
-        )
-
         logger.info(f"Connecting to Braze MCP server: {self.server_command}")
 
-        async with stdio_client(server_params) as (read, write):
+        async with stdio_client(self._server_params) as (read, write):
             async with ClientSession(read, write) as session:
                 # Initialize the session
                 await session.initialize()
@@ -121,13 +194,7 @@ class BrazeMCPClient:
             arguments={"query": query, "limit": limit}
         )
 
-        # Extract text content from result
-        if result.content:
-            for content_block in result.content:
-                if hasattr(content_block, 'text'):
-                    return {"success": True, "content": content_block.text}
-
-        return {"success": False, "content": "No results found"}
+        return _tool_result_to_dict(result, "No results found")
 
     async def get_examples(
         self,
@@ -163,12 +230,7 @@ class BrazeMCPClient:
             }
         )
 
-        if result.content:
-            for content_block in result.content:
-                if hasattr(content_block, 'text'):
-                    return {"success": True, "content": content_block.text}
-
-        return {"success": False, "content": "No examples found"}
+        return _tool_result_to_dict(result, "No examples found")
 
     async def get_event_schema(self, event_key: str) -> dict:
         """Get JSON schema for a Braze event type.
@@ -189,12 +251,7 @@ class BrazeMCPClient:
             arguments={"event_key": event_key}
         )
 
-        if result.content:
-            for content_block in result.content:
-                if hasattr(content_block, 'text'):
-                    return {"success": True, "content": content_block.text}
-
-        return {"success": False, "content": "Schema not found"}
+        return _tool_result_to_dict(result, "Schema not found")
 
     async def get_setup_checklist(self, environment: str = "dev") -> dict:
         """Get structured setup checklist for Braze SDK integration.
@@ -215,102 +272,232 @@ class BrazeMCPClient:
             arguments={"environment": environment}
         )
 
-        if result.content:
-            for content_block in result.content:
-                if hasattr(content_block, 'text'):
-                    return {"success": True, "content": content_block.text}
+        return _tool_result_to_dict(result, "Checklist not found")
 
-        return {"success": False, "content": "Checklist not found"}
 
+class _PersistentMCPSession:
+    """One long-lived MCP session shared by every run_mcp_* call.
 
-def _run_with_retry(coro_func, operation_name: str, timeout: int = 30):
-    """Run async operation with retry logic for race conditions.
+    The stdio server process and session handshake are set up once and kept
+    on a background event loop thread. Synchronous callers submit tool calls
+    to that loop, so calls made from several threads are multiplexed over
+    the same transport (MCP requests carry their own ids) instead of each
+    spawning a server.
+    """
 
-    Uses a global lock to serialize MCP connections and avoid race conditions
-    when multiple tools are called concurrently.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[concurrent.futures.Future] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    def _start_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread (caller holds the lock)."""
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="mcp-session", daemon=True).start()
+        atexit.register(self.close)
+        return loop
+
+    async def _serve(self, ready: concurrent.futures.Future):
+        """Own the connection for its whole lifetime.
+
+        anyio requires the stdio/session contexts to be entered and exited by
+        the same task, so this task holds them open until close() or until
+        the server goes away.
+        """
+        stop = asyncio.Event()
+        try:
+            client = BrazeMCPClient(use_official_server=True)
+            async with client.connect() as connected_client:
+                self._stop = stop
+                ready.set_result(connected_client)
+                await stop.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session closed unexpectedly: {e}")
+        finally:
+            with self._lock:
+                if self._ready is ready:
+                    self._ready = None
+                    self._stop = None
+
+    def _connect(self, timeout: float) -> BrazeMCPClient:
+        """Return the connected client, connecting first if needed."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = self._start_loop()
+            if self._ready is None:
+                self._ready = concurrent.futures.Future()
+                asyncio.run_coroutine_threadsafe(self._serve(self._ready), self._loop)
+            ready = self._ready
 
-    Args:
-        coro_func: Async function to execute
-        operation_name: Name for logging
-        timeout: Timeout in seconds
+        try:
+            return ready.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError(f"MCP server did not initialize within {timeout:.1f}s") from None
+
+    def reset(self):
+        """Drop the current connection so the next call reconnects."""
+        with self._lock:
+            ready, stop = self._ready, self._stop
+            self._ready = None
+            self._stop = None
+        if stop is not None:
+            self._loop.call_soon_threadsafe(stop.set)
+        elif ready is not None and not ready.done():
+            ready.cancel()
+
+    def close(self):
+        """Shut down the connection (registered with atexit)."""
+        self.reset()
+
+    def call(self, operation_name: str, coro_func, total_timeout: float = 30.0):
+        """Run a coroutine against the shared session.
+
+        Transport failures drop the connection and retry with a fresh one,
+        with exponential backoff. All attempts share a single deadline.
 
-    Returns:
-        Result from the async function
-    """
-    last_exception = None
-
-    def _run_with_lock():
-        """Run the async function with lock protection."""
-        with _connection_lock:
-            logger.debug(f"MCP {operation_name}: acquired connection lock")
-            result = asyncio.run(coro_func())
-            logger.debug(f"MCP {operation_name}: success")
-            return result
+        Args:
+            operation_name: Name for logging
+            coro_func: Async function taking the connected BrazeMCPClient
+            total_timeout: Overall time budget in seconds across all attempts
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            # Add jitter on retries
-            if attempt > 0:
-                jitter = random.uniform(0, 0.1 * attempt)
-                time.sleep(jitter)
+        Returns:
+            Result from the async function
 
-            # Check if we're already in an async context
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, need to run in a new thread
-                # The lock must be acquired in the new thread, not here!
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    future = pool.submit(_run_with_lock)
-                    return future.result(timeout=timeout)
-            except RuntimeError:
-                # No running loop, we can use the lock directly
-                return _run_with_lock()
-
-        except Exception as e:
-            last_exception = e
-            error_msg = str(e)
-
-            # Check if it's a race condition that we should retry
-            is_race_condition = "Racing with another loop" in error_msg or "cannot spawn" in error_msg.lower()
-
-            # Log details for debugging
-            logger.info(
-                f"MCP {operation_name} attempt {attempt + 1}/{MAX_RETRIES}: "
-                f"exception={type(e).__name__}, "
-                f"is_race_condition={is_race_condition}, "
-                f"message='{error_msg}'"
-            )
+        Raises:
+            TimeoutError: If the time budget is exhausted
+            FileNotFoundError: If the MCP server command is missing (not retried)
+        """
+        deadline = time.monotonic() + total_timeout
+        last_exception = None
 
-            if is_race_condition:
-                if attempt < MAX_RETRIES - 1:
+        for attempt in range(MAX_RETRIES):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                connected_client = self._connect(remaining)
+                future = asyncio.run_coroutine_threadsafe(coro_func(connected_client), self._loop)
+                try:
+                    result = future.result(timeout=max(deadline - time.monotonic(), 0))
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    raise TimeoutError(f"MCP {operation_name} timed out after {total_timeout}s") from None
+                logger.debug(f"MCP {operation_name}: success")
+                return result
+
+            except TimeoutError:
+                logger.error(f"MCP {operation_name} exceeded {total_timeout}s budget")
+                raise
+
+            except FileNotFoundError:
+                # Missing server command: reconnecting cannot fix it
+                logger.error(f"MCP {operation_name} failed: server command not found")
+                raise
+
+            except Exception as e:
+                last_exception = e
+                logger.info(
+                    f"MCP {operation_name} attempt {attempt + 1}/{MAX_RETRIES} failed: "
+                    f"{type(e).__name__}: {e}"
+                )
+                # The connection may be broken; start over with a fresh one
+                self.reset()
+
+                remaining = deadline - time.monotonic()
+                if attempt < MAX_RETRIES - 1 and remaining > 0:
                     delay = min(INITIAL_RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
                     delay += random.uniform(0, delay * 0.5)  # Add jitter
-                    logger.warning(
-                        f"MCP {operation_name} attempt {attempt + 1} failed with race condition, "
-                        f"retrying in {delay:.2f}s: {error_msg}"
-                    )
-                    time.sleep(delay)
-                    continue
-                else:
-                    # Last attempt failed with race condition
-                    logger.error(f"MCP {operation_name} failed after {MAX_RETRIES} attempts with race condition: {error_msg}")
-                    raise
-
-            # Not a retryable error
-            logger.error(f"MCP {operation_name} failed with non-retryable error: {e}")
+                    time.sleep(min(delay, remaining))
+
+        if last_exception is None:
+            raise TimeoutError(f"MCP {operation_name} timed out after {total_timeout}s")
+        logger.error(f"MCP {operation_name} failed after {MAX_RETRIES} attempts: {last_exception}")
+        raise last_exception
+
+
+_mcp_session = _PersistentMCPSession()
+
+
+def _cache_result(func):
+    """Memoize a run_mcp_* wrapper in _MCP_RESULT_CACHE.
+
+    The key is the function name plus its bound arguments with defaults
+    applied, so positional and keyword spellings of a call share an entry.
+    Concurrent identical calls are coalesced onto the first one. Only real
+    results are cached: _MCPNoResult replies (not found, tool errors) are
+    returned as text uncached, and exceptions are raised to every caller
+    joined to the failed call.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, tuple(bound.arguments.items()))
+
+        cached = _MCP_RESULT_CACHE.get(key)
+        if cached is not None:
+            logger.debug(f"MCP cache hit: {func.__name__}{tuple(bound.arguments.values())}")
+            return cached
+
+        with _MCP_INFLIGHT_LOCK:
+            # A leader may have stored its result and left between the cache
+            # check above and taking the lock
+            cached = _MCP_RESULT_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+            inflight = _MCP_INFLIGHT.get(key)
+            if inflight is None:
+                inflight = _MCP_INFLIGHT[key] = concurrent.futures.Future()
+                is_leader = True
+            else:
+                is_leader = False
+
+        if not is_leader:
+            # Bounded by the leader's own MCP time budget
+            logger.debug(f"MCP call joined in-flight request: {func.__name__}{tuple(bound.arguments.values())}")
+            return inflight.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except _MCPNoResult as e:
+            # Not-found and tool-error replies go back to the caller as text,
+            # but are not cached so the next call asks the server again
+            logger.debug(f"MCP {func.__name__} returned no result, not caching: {e}")
+            inflight.set_result(str(e))
+            return str(e)
+        except BaseException as e:
+            inflight.set_exception(e)
             raise
+        else:
+            _MCP_RESULT_CACHE.set(key, result)
+            inflight.set_result(result)
+            return result
+        finally:
+            with _MCP_INFLIGHT_LOCK:
+                _MCP_INFLIGHT.pop(key, None)
+
+    return wrapper
+
 
-    # All retries exhausted
-    logger.error(f"MCP {operation_name} failed after {MAX_RETRIES} attempts")
-    raise last_exception
+def clear_mcp_cache():
+    """Clear cached MCP results (e.g. when resetting an agent session)."""
+    _MCP_RESULT_CACHE.clear()
 
 
+@_cache_result
 def run_mcp_search(query: str, limit: int = 5) -> str:
     """Synchronous wrapper for MCP documentation search.
 
-    Uses the official Braze MCP server for comprehensive documentation access.
+    Common SDK questions are answered from the bundled SDK reference
+    sections first; only misses go to the official Braze MCP server.
 
     Args:
         query: Search query
@@ -319,15 +506,26 @@ def run_mcp_search(query: str, limit: int = 5) -> str:
     Returns:
         str: Search results as formatted text
     """
-    async def _search():
-        client = BrazeMCPClient(use_official_server=True)
-        async with client.connect() as connected_client:
-            result = await connected_client.search_documentation(query, limit=limit)
-            return result.get("content", "No results found")
+    global _local_lookup_hits, _local_lookup_total
 
-    return _run_with_retry(_search, "search", timeout=30)
+    local_results = local_reference_lookup(query, k=min(limit, 3))
+    _local_lookup_total += 1
+    if local_results:
+        _local_lookup_hits += 1
+    logger.debug(
+        f"MCP search local lookup {'hit' if local_results else 'miss'} for '{query}' "
+        f"(hit ratio {_local_lookup_hits}/{_local_lookup_total})"
+    )
+    if local_results:
+        return "\n\n".join(local_results)
 
+    async def _search(connected_client: BrazeMCPClient):
+        return await connected_client.search_documentation(query, limit=limit)
 
+    return _result_content(_mcp_session.call("search", _search, total_timeout=30.0))
+
+
+@_cache_result
 def run_mcp_get_examples(
     topic: str,
     language: str = "javascript",
@@ -345,20 +543,18 @@ def run_mcp_get_examples(
     Returns:
         str: Code examples as formatted text
     """
-    async def _get_examples():
-        client = BrazeMCPClient(use_official_server=True)
-        async with client.connect() as connected_client:
-            result = await connected_client.get_examples(
-                topic=topic,
-                language=language,
-                sdk=sdk,
-                limit=limit
-            )
-            return result.get("content", "No examples found")
+    async def _get_examples(connected_client: BrazeMCPClient):
+        return await connected_client.get_examples(
+            topic=topic,
+            language=language,
+            sdk=sdk,
+            limit=limit
+        )
 
-    return _run_with_retry(_get_examples, "get_examples", timeout=30)
+    return _result_content(_mcp_session.call("get_examples", _get_examples, total_timeout=30.0))
 
 
+@_cache_result
 def run_mcp_get_event_schema(event_key: str) -> str:
     """Synchronous wrapper for MCP event schema.
 
@@ -368,15 +564,13 @@ def run_mcp_get_event_schema(event_key: str) -> str:
     Returns:
         str: Event schema as formatted text
     """
-    async def _get_schema():
-        client = BrazeMCPClient(use_official_server=True)
-        async with client.connect() as connected_client:
-            result = await connected_client.get_event_schema(event_key)
-            return result.get("content", "Schema not found")
+    async def _get_schema(connected_client: BrazeMCPClient):
+        return await connected_client.get_event_schema(event_key)
 
-    return _run_with_retry(_get_schema, "get_event_schema", timeout=30)
+    return _result_content(_mcp_session.call("get_event_schema", _get_schema, total_timeout=30.0))
 
 
+@_cache_result
 def run_mcp_get_setup_checklist(environment: str = "dev") -> str:
     """Synchronous wrapper for MCP setup checklist.
 
@@ -386,10 +580,7 @@ def run_mcp_get_setup_checklist(environment: str = "dev") -> str:
     Returns:
         str: Setup checklist as formatted text
     """
-    async def _get_checklist():
-        client = BrazeMCPClient(use_official_server=True)
-        async with client.connect() as connected_client:
-            result = await connected_client.get_setup_checklist(environment)
-            return result.get("content", "Checklist not found")
+    async def _get_checklist(connected_client: BrazeMCPClient):
+        return await connected_client.get_setup_checklist(environment)
 
-    return _run_with_retry(_get_checklist, "get_setup_checklist", timeout=30)
+    return _result_content(_mcp_session.call("get_setup_checklist", _get_checklist, total_timeout=30.0))
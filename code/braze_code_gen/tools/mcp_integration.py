@@ -10,6 +10,13 @@ from typing import Annotated
 
 from langchain_core.tools import tool
 
+from braze_code_gen.tools.mcp_client import (
+    run_mcp_search,
+    run_mcp_get_examples,
+    run_mcp_get_event_schema,
+    run_mcp_get_setup_checklist,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +55,6 @@ def search_braze_docs(
         str: Relevant documentation content with page titles, URLs, and snippets
     """
     try:
-        from braze_code_gen.tools.mcp_client import run_mcp_search
         result = run_mcp_search(query, limit=5)
         return result
     except Exception as e:
@@ -87,7 +93,6 @@ def get_braze_code_examples(
         str: Code examples with explanations from Braze documentation
     """
     try:
-        from braze_code_gen.tools.mcp_client import run_mcp_get_examples
         result = run_mcp_get_examples(
             topic=topic,
             language="javascript",
@@ -122,7 +127,6 @@ def get_braze_event_schema(
         str: JSON schema with field descriptions and examples
     """
     try:
-        from braze_code_gen.tools.mcp_client import run_mcp_get_event_schema
         result = run_mcp_get_event_schema(event_key)
         return result
     except Exception as e:
@@ -146,7 +150,6 @@ def get_braze_setup_checklist(
         str: Structured checklist with setup steps and time estimates
     """
     try:
-        from braze_code_gen.tools.mcp_client import run_mcp_get_setup_checklist
         result = run_mcp_get_setup_checklist(environment)
         return result
     except Exception as e:
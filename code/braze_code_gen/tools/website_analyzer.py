@@ -6,15 +6,19 @@ This module provides functionality to scrape customer websites and extract:
 """
 
 import re
+import time
 import logging
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, NamedTuple, Tuple, Union
 from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import urllib3
 
 import requests
-from bs4 import BeautifulSoup
-import cssutils
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+import tinycss2
 
 from braze_code_gen.core.models import (
     BrandingData,
@@ -23,17 +27,94 @@ from braze_code_gen.core.models import (
     DEFAULT_BRAZE_COLORS,
     DEFAULT_BRAZE_TYPOGRAPHY,
 )
+from braze_code_gen.utils.cache import TTLCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Suppress cssutils warnings
-cssutils.log.setLevel(logging.CRITICAL)
-
 # Suppress SSL warnings when verification is disabled
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Precompiled patterns used in the extraction hot loops.
+# Hex colors only match in value position, so compound selectors like a#top
+# are not mistaken for colors.
+_COLOR_RE = re.compile(
+    r'(?<=[:\s,(])#(?:[0-9A-Fa-f]{8}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{3,4})\b|rgba?\([^)]+\)'
+)
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_HEX3_RE = re.compile(r'^#[0-9a-f]{3}$')
+_RGB_PARSE_RE = re.compile(r'rgba?\((\d+),\s*(\d+),\s*(\d+)')
+_GOOGLE_FONT_RE = re.compile(r'family=([^&:]+)')
+_IMPORTANT_RE = re.compile(r'!important')
+
+# Generic families and CSS-wide keywords that never name a brand font
+_GENERIC_FAMILIES = frozenset({
+    'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy',
+    'system-ui', 'ui-sans-serif', 'ui-serif', 'ui-monospace', 'ui-rounded',
+    'inherit', 'initial', 'unset', 'revert',
+})
+_BW_COLORS = frozenset({'#FFFFFF', '#000000'})
+
+# Shared stylesheets (CDN frameworks, Google Fonts) recur across sites, so CSS
+# is cached process-wide, keyed by (url, user agent). Only successful fetches
+# are cached.
+_CSS_CACHE = TTLCache(maxsize=256, ttl=3600)
+
+
+class _StyleSources(NamedTuple):
+    """Styling inputs collected from a page in a single DOM pass."""
+
+    inline_styles: List[str]
+    style_blocks: List[str]
+    stylesheet_urls: List[str]
+    font_links: List[str]
+
+
+def _font_families_from_css(css_text: Union[str, list], inline: bool = False) -> List[str]:
+    """Collect font-family values from CSS using tinycss2.
+
+    Handles multi-line declarations and nested at-rules (@media, @supports),
+    and picks up @font-face families without any extra fetches.
+
+    Args:
+        css_text: Stylesheet text (or tokens), or a declaration list when inline is True
+        inline: Whether css_text is a style attribute value
+
+    Returns:
+        List[str]: Serialized font-family values in document order
+    """
+    if inline:
+        nodes = tinycss2.parse_declaration_list(css_text, skip_comments=True, skip_whitespace=True)
+    else:
+        nodes = tinycss2.parse_stylesheet(css_text, skip_comments=True, skip_whitespace=True)
+
+    families: List[str] = []
+    for node in nodes:
+        if node.type == 'declaration':
+            if node.lower_name == 'font-family':
+                value = tinycss2.serialize(node.value).strip()
+                # Custom properties can't be resolved without the cascade
+                if value and not value.lower().startswith('var('):
+                    families.append(value)
+        elif node.type == 'qualified-rule':
+            families.extend(_font_families_from_css(node.content, inline=True))
+        elif node.type == 'at-rule' and node.content is not None:
+            if node.lower_at_keyword == 'font-face':
+                families.extend(_font_families_from_css(node.content, inline=True))
+            else:
+                families.extend(_font_families_from_css(node.content))
+    return families
+
+
+def _is_retryable_status(status_code: Optional[int]) -> bool:
+    """Check whether an HTTP error status is worth retrying.
+
+    Only server errors and rate limiting are transient; other 4xx responses
+    (404, 403, 410, ...) will not change on a second attempt.
+    """
+    return status_code is not None and (status_code >= 500 or status_code == 429)
+
 
 class WebsiteAnalyzer:
     """Analyzer for extracting branding data from websites."""
@@ -42,7 +123,8 @@ class WebsiteAnalyzer:
         self,
         timeout: int = 10,
         max_retries: int = 2,
-        user_agents: Optional[List[str]] = None
+        user_agents: Optional[List[str]] = None,
+        max_bytes: int = 2 * 1024 * 1024
     ):
         """Initialize the website analyzer.
 
@@ -50,14 +132,42 @@ class WebsiteAnalyzer:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             user_agents: List of User-Agent strings to try
+            max_bytes: Maximum bytes read from any HTML/CSS response body
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_bytes = max_bytes
         self.user_agents = user_agents or [
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         ]
 
+        # Pooled sessions so the page and its stylesheets reuse TCP/TLS
+        # connections. The unverified session is only used for the SSL fallback.
+        self._session = self._create_session(verify=True)
+        self._insecure_session = self._create_session(verify=False)
+
+        # Analysis results keyed by normalized URL
+        self._result_cache = TTLCache(maxsize=128, ttl=3600)
+
+    @staticmethod
+    def _create_session(verify: bool) -> requests.Session:
+        """Create a requests session with a keep-alive connection pool.
+
+        Args:
+            verify: Whether to verify SSL certificates
+
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        session.verify = verify
+        # Retries are handled by the fetch methods themselves
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def analyze_website(self, url: str) -> BrandingData:
         """Analyze website and extract branding data.
 
@@ -79,6 +189,12 @@ class WebsiteAnalyzer:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
 
+        cache_key = url.rstrip('/')
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached branding for {url}")
+            return cached
+
         # Try to fetch website
         html_content = self._fetch_website(url)
 
@@ -86,14 +202,39 @@ class WebsiteAnalyzer:
             logger.warning(f"Failed to fetch {url}, using default branding")
             return self._create_fallback_branding(url, "Failed to fetch website")
 
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML once (Lexbor builds the tree in C) and share it between extractors
+        tree = LexborHTMLParser(html_content)
+
+        sources = self._collect_style_sources(tree, url)
+
+        # Fetch linked stylesheets concurrently (limited to first 3)
+        css_contents = self._fetch_stylesheets(sources.stylesheet_urls[:3])
+
+        branding = self._build_branding(url, sources, css_contents)
+        self._result_cache.set(cache_key, branding)
+        return branding
+
+    def _build_branding(
+        self,
+        url: str,
+        sources: _StyleSources,
+        css_contents: List[Optional[str]]
+    ) -> BrandingData:
+        """Run the extractors on fetched content and assemble BrandingData.
+
+        Args:
+            url: Website URL
+            sources: Style sources collected from the page
+            css_contents: Fetched linked stylesheets (None for failed fetches)
 
+        Returns:
+            BrandingData: Extracted branding, with defaults filling any gaps
+        """
         # Extract colors
-        colors = self._extract_colors(soup, html_content, url)
+        colors = self._extract_colors(sources, css_contents)
 
         # Extract typography
-        typography = self._extract_typography(soup, html_content, url)
+        typography = self._extract_typography(sources)
 
         # Determine if extraction was successful (at least one extraction succeeded)
         extraction_success = colors is not None or typography is not None
@@ -146,65 +287,152 @@ class WebsiteAnalyzer:
             headers = {'User-Agent': user_agent}
 
             try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                    verify=True
-                )
-                response.raise_for_status()
-                return response.text
+                return self._get_capped(self._session, url, headers, self.timeout)
 
             except requests.exceptions.SSLError as e:
                 ssl_error_occurred = True
                 logger.debug(f"SSL certificate verification failed for {url}: {str(e)}")
+                break  # A bad certificate will not fix itself on retry
+
+            except requests.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else None
+                logger.warning(f"HTTP {status_code} fetching {url} (attempt {attempt + 1}/{self.max_retries})")
+                if not _is_retryable_status(status_code):
+                    break
 
             except requests.Timeout:
                 logger.warning(f"Timeout fetching {url} (attempt {attempt + 1}/{self.max_retries})")
 
-            except requests.RequestException as e:
+            except requests.ConnectionError as e:
                 logger.warning(f"Error fetching {url}: {str(e)} (attempt {attempt + 1}/{self.max_retries})")
 
+            except requests.RequestException as e:
+                # Invalid URL, too many redirects, ... - retrying cannot help
+                logger.warning(f"Error fetching {url}: {str(e)}")
+                break
+
+            # Back off before retrying a transient failure
+            if attempt + 1 < self.max_retries:
+                time.sleep(min(0.1 * 2 ** attempt, 1.0))
+
         # If SSL error occurred, retry once without verification
         if ssl_error_occurred:
             logger.debug(f"Retrying {url} with SSL verification disabled")
             try:
-                response = requests.get(
+                html_content = self._get_capped(
+                    self._insecure_session,
                     url,
-                    headers={'User-Agent': self.user_agents[0]},
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                    verify=False  # Disable SSL verification as fallback
+                    {'User-Agent': self.user_agents[0]},
+                    self.timeout
                 )
-                response.raise_for_status()
                 logger.debug(f"Successfully fetched {url} with SSL verification disabled")
-                return response.text
+                return html_content
 
             except requests.RequestException as e:
                 logger.warning(f"Failed to fetch {url} even with SSL verification disabled: {str(e)}")
 
         return None
 
+    def _get_capped(
+        self,
+        session: requests.Session,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float
+    ) -> str:
+        """GET a URL and decode at most max_bytes of the body.
+
+        The body is streamed so oversized pages are never fully downloaded;
+        branding CSS lives near the top of the document anyway.
+
+        Args:
+            session: Session to fetch with
+            url: URL to fetch
+            headers: Request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            str: Decoded (possibly truncated) response body
+
+        Raises:
+            requests.RequestException: On connection errors or HTTP error status
+        """
+        with session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            content_length = response.headers.get('Content-Length', '')
+            if content_length.isdigit() and int(content_length) > self.max_bytes:
+                logger.debug(f"{url} is {content_length} bytes, reading first {self.max_bytes}")
+            body = response.raw.read(self.max_bytes, decode_content=True)
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    def _collect_style_sources(self, tree: LexborHTMLParser, base_url: str) -> _StyleSources:
+        """Walk the DOM once and collect every styling input the extractors need.
+
+        Args:
+            tree: Parsed HTML tree
+            base_url: Base URL for resolving relative links
+
+        Returns:
+            _StyleSources: Inline styles, style blocks, stylesheet URLs and Google Fonts links
+        """
+        sources = _StyleSources([], [], [], [])
+
+        # One selector query, dispatched per node, instead of a query per extractor.
+        # :is() keeps nodes that match several alternatives from being returned twice.
+        for node in tree.css(':is([style], style, link[href])'):
+            attributes = node.attributes
+
+            style = attributes.get('style')
+            if style:
+                sources.inline_styles.append(style)
+
+            if node.tag == 'style':
+                style_text = node.text()
+                if style_text:
+                    sources.style_blocks.append(style_text)
+
+            elif node.tag == 'link':
+                href = attributes.get('href')
+                if not href:
+                    continue
+                if 'stylesheet' in (attributes.get('rel') or '').lower().split():
+                    sources.stylesheet_urls.append(urljoin(base_url, href))
+                if 'fonts.googleapis.com' in href:
+                    sources.font_links.append(href)
+
+        return sources
+
+    def _fetch_stylesheets(self, css_urls: List[str]) -> List[Optional[str]]:
+        """Fetch stylesheets concurrently.
+
+        Args:
+            css_urls: Stylesheet URLs
+
+        Returns:
+            List[Optional[str]]: CSS content per URL, None for failed fetches
+        """
+        if not css_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=len(css_urls)) as executor:
+            return list(executor.map(self._fetch_css, css_urls))
+
     def _extract_colors(
         self,
-        soup: BeautifulSoup,
-        html_content: str,
-        base_url: str
+        sources: _StyleSources,
+        css_contents: List[Optional[str]]
     ) -> Optional[ColorScheme]:
         """Extract color scheme from website.
 
         Strategy:
-        1. Parse inline styles and style tags
-        2. Fetch and parse linked stylesheets
+        1. Scan inline styles and style tags (never body text)
+        2. Parse the fetched linked stylesheets
         3. Extract all color values (hex, rgb, rgba)
         4. Use frequency analysis to identify primary colors
         5. Categorize by usage (background, text, accent)
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            html_content: Raw HTML content
-            base_url: Base URL for resolving relative links
+            sources: Style sources collected from the page
+            css_contents: Fetched linked stylesheets (None for failed fetches)
 
         Returns:
             Optional[ColorScheme]: Extracted colors or None if failed
@@ -212,20 +440,13 @@ class WebsiteAnalyzer:
         logger.info("Extracting colors...")
         colors_found: List[str] = []
 
-        # 1. Extract from inline styles
-        for element in soup.find_all(style=True):
-            style = element['style']
-            colors_found.extend(self._parse_colors_from_css(style))
-
-        # 2. Extract from style tags
-        for style_tag in soup.find_all('style'):
-            if style_tag.string:
-                colors_found.extend(self._parse_colors_from_css(style_tag.string))
-
-        # 3. Extract from linked stylesheets (limited to first 3)
-        for link in soup.find_all('link', rel='stylesheet', href=True)[:3]:
-            css_url = urljoin(base_url, link['href'])
-            css_content = self._fetch_css(css_url)
+        # 1. Extract from inline styles and style tags, already collected in the
+        # single DOM pass, so hex-looking words in body text are never counted
+        for css_text in (*sources.inline_styles, *sources.style_blocks):
+            colors_found.extend(self._parse_colors_from_css(css_text))
+
+        # 2. Extract from linked stylesheets
+        for css_content in css_contents:
             if css_content:
                 colors_found.extend(self._parse_colors_from_css(css_content))
 
@@ -233,21 +454,25 @@ class WebsiteAnalyzer:
             logger.warning("No colors found in website")
             return None
 
-        # Normalize and count colors
-        normalized_colors = [self._normalize_color(c) for c in colors_found]
-        normalized_colors = [c for c in normalized_colors if c]  # Remove None values
-        color_counts = Counter(normalized_colors)
+        # Count raw literals first so each distinct literal is normalized once
+        # (pages repeat the same few colors thousands of times)
+        color_counts: Counter = Counter()
+        for literal, count in Counter(colors_found).items():
+            normalized = self._normalize_color(literal)
+            if normalized:
+                color_counts[normalized] += count
 
-        # Get most common colors
-        most_common = color_counts.most_common(10)
-        logger.info(f"Found {len(most_common)} unique colors")
+        # Pull black/white out before ranking; they only influence the text color
+        bw_counts = {bw: color_counts.pop(bw) for bw in _BW_COLORS if bw in color_counts}
+        unique_colors = len(color_counts) + len(bw_counts)
+        logger.info(f"Found {unique_colors} unique colors")
 
-        if len(most_common) < 3:
+        if unique_colors < 3:
             logger.warning("Not enough colors found")
             return None
 
-        # Categorize colors
-        return self._categorize_colors(most_common)
+        # Top 5 brand colors plus black/white cover every slot _categorize_colors reads
+        return self._categorize_colors(color_counts.most_common(5), bw_counts)
 
     def _parse_colors_from_css(self, css_text: str) -> List[str]:
         """Parse colors from CSS text.
@@ -258,17 +483,8 @@ class WebsiteAnalyzer:
         Returns:
             List[str]: List of color values found
         """
-        colors = []
-
-        # Hex colors
-        hex_colors = re.findall(r'#[0-9A-Fa-f]{6}|#[0-9A-Fa-f]{3}', css_text)
-        colors.extend(hex_colors)
-
-        # RGB/RGBA colors
-        rgb_colors = re.findall(r'rgba?\([^)]+\)', css_text)
-        colors.extend(rgb_colors)
-
-        return colors
+        # Hex and RGB/RGBA colors in a single pass
+        return _COLOR_RE.findall(css_text)
 
     def _normalize_color(self, color: str) -> Optional[str]:
         """Normalize color to 6-digit hex format.
@@ -279,38 +495,50 @@ class WebsiteAnalyzer:
         Returns:
             Optional[str]: Normalized hex color or None
         """
-        color = color.strip().lower()
+        color = color.strip()
 
-        # Already 6-digit hex
-        if re.match(r'^#[0-9a-f]{6}$', color):
+        # #RRGGBBAA / #RGBA - drop the alpha digits
+        if color[:1] == '#' and len(color) in (5, 9):
+            color = color[:7] if len(color) == 9 else color[:4]
+
+        # Already 6-digit hex (the dominant case) - no regex needed
+        if len(color) == 7 and color[0] == '#' and _HEX_DIGITS.issuperset(color[1:]):
             return color.upper()
 
+        color = color.lower()
+
         # 3-digit hex - expand
-        if re.match(r'^#[0-9a-f]{3}$', color):
+        if _HEX3_RE.match(color):
             return '#' + ''.join([c*2 for c in color[1:]]).upper()
 
         # RGB/RGBA - convert to hex
         if color.startswith('rgb'):
-            match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+)', color)
+            match = _RGB_PARSE_RE.match(color)
             if match:
                 r, g, b = match.groups()
                 return f"#{int(r):02X}{int(g):02X}{int(b):02X}"
 
         return None
 
-    def _categorize_colors(self, color_counts: List[Tuple[str, int]]) -> ColorScheme:
+    def _categorize_colors(
+        self,
+        color_counts: List[Tuple[str, int]],
+        bw_counts: Dict[str, int]
+    ) -> ColorScheme:
         """Categorize colors into primary, secondary, accent, etc.
 
         Args:
-            color_counts: List of (color, count) tuples
+            color_counts: Most common non black/white (color, count) tuples
+            bw_counts: Counts of pure white and black (often background/text)
 
         Returns:
             ColorScheme: Categorized colors
         """
-        colors = [c[0] for c in color_counts]
+        non_bw_colors = [c[0] for c in color_counts]
 
-        # Filter out pure white and black (often background/text)
-        non_bw_colors = [c for c in colors if c not in ['#FFFFFF', '#000000']]
+        # Overall ranking with black/white merged back in (a handful of items)
+        ranked = sorted([*color_counts, *bw_counts.items()], key=itemgetter(1), reverse=True)
+        colors = [c[0] for c in ranked]
 
         if len(non_bw_colors) >= 3:
             primary = non_bw_colors[0]
@@ -345,12 +573,7 @@ class WebsiteAnalyzer:
             text=text
         )
 
-    def _extract_typography(
-        self,
-        soup: BeautifulSoup,
-        html_content: str,
-        base_url: str
-    ) -> Optional[TypographyData]:
+    def _extract_typography(self, sources: _StyleSources) -> Optional[TypographyData]:
         """Extract typography from website.
 
         Strategy:
@@ -360,9 +583,7 @@ class WebsiteAnalyzer:
         4. Identify most common fonts
 
         Args:
-            soup: BeautifulSoup parsed HTML
-            html_content: Raw HTML content
-            base_url: Base URL
+            sources: Style sources collected from the page
 
         Returns:
             Optional[TypographyData]: Extracted typography or None
@@ -371,25 +592,20 @@ class WebsiteAnalyzer:
         fonts_found: List[str] = []
 
         # 1. Extract from inline styles
-        for element in soup.find_all(style=True):
-            style = element['style']
-            font_families = re.findall(r'font-family:\s*([^;]+)', style)
-            fonts_found.extend(font_families)
+        for style in sources.inline_styles:
+            fonts_found.extend(_font_families_from_css(style, inline=True))
 
-        # 2. Extract from style tags
-        for style_tag in soup.find_all('style'):
-            if style_tag.string:
-                font_families = re.findall(r'font-family:\s*([^;]+)', style_tag.string)
-                fonts_found.extend(font_families)
+        # 2. Extract from style tags (including @font-face and @media rules)
+        for style_text in sources.style_blocks:
+            fonts_found.extend(_font_families_from_css(style_text))
 
         # 3. Check for Google Fonts
         google_fonts = []
-        for link in soup.find_all('link', href=True):
-            if 'fonts.googleapis.com' in link['href']:
-                # Extract font name from URL
-                match = re.search(r'family=([^&:]+)', link['href'])
-                if match:
-                    google_fonts.append(match.group(1).replace('+', ' '))
+        for href in sources.font_links:
+            # Extract font name from URL
+            match = _GOOGLE_FONT_RE.search(href)
+            if match:
+                google_fonts.append(match.group(1).replace('+', ' '))
 
         if not fonts_found and not google_fonts:
             logger.warning("No fonts found in website")
@@ -430,13 +646,13 @@ class WebsiteAnalyzer:
         font_family = font_family.strip().strip('"').strip("'")
 
         # Remove !important
-        font_family = re.sub(r'!important', '', font_family).strip()
+        font_family = _IMPORTANT_RE.sub('', font_family).strip()
 
         # Take first font in stack
         if ',' in font_family:
             fonts = [f.strip().strip('"').strip("'") for f in font_family.split(',')]
             # Skip generic families
-            fonts = [f for f in fonts if f.lower() not in ['sans-serif', 'serif', 'monospace', 'cursive', 'fantasy']]
+            fonts = [f for f in fonts if f.lower() not in _GENERIC_FAMILIES]
             if fonts:
                 font_family = fonts[0]
             else:
@@ -453,6 +669,23 @@ class WebsiteAnalyzer:
         return font_family
 
     def _fetch_css(self, url: str) -> Optional[str]:
+        """Fetch CSS file content, served from the shared cache when possible.
+
+        Args:
+            url: CSS file URL
+
+        Returns:
+            Optional[str]: CSS content or None
+        """
+        cache_key = (url, self.user_agents[0])
+        css_content = _CSS_CACHE.get(cache_key)
+        if css_content is None:
+            css_content = self._request_css(url)
+            if css_content is not None:
+                _CSS_CACHE.set(cache_key, css_content)
+        return css_content
+
+    def _request_css(self, url: str) -> Optional[str]:
         """Fetch CSS file content with SSL fallback.
 
         Args:
@@ -461,26 +694,13 @@ class WebsiteAnalyzer:
         Returns:
             Optional[str]: CSS content or None
         """
+        headers = {'User-Agent': self.user_agents[0]}
         try:
-            response = requests.get(
-                url,
-                headers={'User-Agent': self.user_agents[0]},
-                timeout=5,
-                verify=True
-            )
-            response.raise_for_status()
-            return response.text
+            return self._get_capped(self._session, url, headers, 5)
         except requests.exceptions.SSLError:
             # Retry with SSL verification disabled
             try:
-                response = requests.get(
-                    url,
-                    headers={'User-Agent': self.user_agents[0]},
-                    timeout=5,
-                    verify=False
-                )
-                response.raise_for_status()
-                return response.text
+                return self._get_capped(self._insecure_session, url, headers, 5)
             except requests.RequestException:
                 return None
         except requests.RequestException:
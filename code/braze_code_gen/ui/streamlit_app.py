@@ -5,22 +5,58 @@ with real-time token-level streaming updates and cancellation support.
 """
 
 import os
+import queue
 import logging
 import base64
 from pathlib import Path
-from typing import Optional
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Optional
 
-# IMPORTANT: Load environment variables FIRST before any other imports
-from dotenv import load_dotenv
-load_dotenv()
+# IMPORTANT: Load environment variables FIRST before any other imports.
+# Streamlit re-executes this script on every interaction, so only parse .env
+# once per process.
+if not os.getenv("_BRAZE_ENV_LOADED"):
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ["_BRAZE_ENV_LOADED"] = "1"
 
 import streamlit as st
 
-from braze_code_gen.agents.orchestrator import Orchestrator
 from braze_code_gen.core.models import BrazeAPIConfig
 
+# The orchestrator pulls in the LangChain/LLM stack (seconds to import), so it
+# and the callback handler are imported only when a generation starts.
+if TYPE_CHECKING:
+    from braze_code_gen.agents.orchestrator import Orchestrator
+    from braze_code_gen.ui.streamlit_callbacks import StreamlitTokenCallbackHandler
+
 logger = logging.getLogger(__name__)
 
+# Fragment polling intervals while streaming. Workflow updates are queued by
+# the generation worker and drained in one go per tick, so a 4 Hz progress tick
+# still reads smoothly; the sidebar only shows the active agent name and can
+# poll even less often.
+PROGRESS_POLL_INTERVAL = 0.25
+SIDEBAR_POLL_INTERVAL = 1.0
+
+# Characters of live agent output kept per node. Only the tail is visible, and
+# capping it bounds both memory and the per-tick markdown render.
+THINKING_TAIL_CHARS = 4096
+
+# Workflow nodes in display order
+NODE_ORDER = ("planning", "research", "code_generation", "validation", "refinement", "finalization")
+
+# Fixed card headers, built once instead of on every render
+AGENT_SIDEBAR_HEADER_HTML = """
+<div class="agent-sidebar-header">
+    <div class="braze-logo-small"></div>
+    <span>Active Agent</span>
+</div>
+"""
+STATUS_HEADER_HTML = '<div class="status-card-header">⚙️ Generation Progress</div>'
+SUCCESS_HEADER_HTML = '<div class="success-card-header">✅ Generation Complete</div>'
+THINKING_SPINNER_HTML = '<div class="thinking-spinner"></div>'
+
 # Page configuration with dark theme
 st.set_page_config(
     page_title="Braze Landing Page Generator",
@@ -34,67 +70,91 @@ st.set_page_config(
     }
 )
 
-# Load custom CSS
-CSS_PATH = Path(__file__).parent / "streamlit_styles.css"
-if CSS_PATH.exists():
-    st.markdown(f"<style>{CSS_PATH.read_text()}</style>", unsafe_allow_html=True)
-else:
-    st.error(f"CSS file not found at {CSS_PATH}")
-
 # ============================================
-# Session State Initialization
+# Static Assets
 # ============================================
+# Streamlit re-executes this script on every interaction. Assets are cached by
+# (path, mtime), so a rerun costs one stat() and edits still show up.
 
-def init_session_state():
-    """Initialize all session state variables."""
-    from threading import Event
-
-    # Orchestrator instance
-    if "orchestrator" not in st.session_state:
-        st.session_state.orchestrator = Orchestrator(
-            export_dir="/tmp/braze_exports",
-            enable_browser_testing=True
-        )
+@st.cache_data(show_spinner=False)
+def _read_text_asset(path: str, mtime: float) -> str:
+    """Read a text asset (cached per path and modification time)."""
+    return Path(path).read_text()
 
-    # API Configuration
-    if "api_config" not in st.session_state:
-        st.session_state.api_config = None
 
-    # Streaming Control (UI-agnostic cancellation using threading.Event)
-    if "streaming_active" not in st.session_state:
-        st.session_state.streaming_active = False
+@st.cache_data(show_spinner=False)
+def _read_base64_asset(path: str, mtime: float) -> str:
+    """Read and base64-encode a binary asset (cached per path and modification time)."""
+    return base64.b64encode(Path(path).read_bytes()).decode()
 
-    if "stop_event" not in st.session_state:
-        st.session_state.stop_event = Event()
 
-    # Results
-    if "export_path" not in st.session_state:
-        st.session_state.export_path = None
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_export_bytes(path: str, mtime: float) -> bytes:
+    """Read an exported landing page for download (cached per path and modification time)."""
+    return Path(path).read_bytes()
 
-    if "branding_data" not in st.session_state:
-        st.session_state.branding_data = None
 
-    if "generation_complete" not in st.session_state:
-        st.session_state.generation_complete = False
+# Load custom CSS
+CSS_PATH = Path(__file__).parent / "streamlit_styles.css"
+try:
+    css_text = _read_text_asset(str(CSS_PATH), CSS_PATH.stat().st_mtime)
+except FileNotFoundError:
+    st.error(f"CSS file not found at {CSS_PATH}")
+else:
+    st.markdown(f"<style>{css_text}</style>", unsafe_allow_html=True)
 
-    # Status Tracking (using node-based state instead of list manipulation)
-    if "node_states" not in st.session_state:
-        st.session_state.node_states = {}
+# ============================================
+# Session State Initialization
+# ============================================
+
+@st.cache_resource(show_spinner="Loading agents...")
+def get_orchestrator() -> "Orchestrator":
+    """Build the orchestrator once per process and share it across sessions.
 
-    # Agent Output (for token streaming)
-    if "agent_output" not in st.session_state:
-        st.session_state.agent_output = ""
+    The orchestrator holds no per-user state: each session keeps its own
+    BrazeAPIConfig and passes it to generate_streaming.
+    """
+    from braze_code_gen.agents.orchestrator import Orchestrator
 
-    if "current_agent" not in st.session_state:
-        st.session_state.current_agent = ""
+    return Orchestrator(
+        export_dir="/tmp/braze_exports",
+        enable_browser_testing=True
+    )
 
-    # Token-level streaming state (NEW)
-    if "current_node_name" not in st.session_state:
-        st.session_state.current_node_name = None
-    if "node_thinking_text" not in st.session_state:
-        st.session_state.node_thinking_text = {}  # {node_name: accumulated_tokens}
-    if "node_start_times" not in st.session_state:
-        st.session_state.node_start_times = {}  # Track when each node started
+
+def init_session_state():
+    """Initialize all session state variables.
+
+    The shared orchestrator is not created here; get_orchestrator() builds it
+    on the first generation so the page renders without importing it.
+    """
+    defaults = {
+        # API Configuration
+        "api_config": None,
+        # Streaming Control (UI-agnostic cancellation using threading.Event)
+        "streaming_active": False,
+        "stop_event": Event(),
+        # Results
+        "export_path": None,
+        "branding_data": None,
+        "generation_complete": False,
+        # Status Tracking (using node-based state instead of list manipulation)
+        "node_states": {},
+        # Agent Output (for token streaming)
+        "agent_output": "",
+        "current_agent": "",
+        # Token-level streaming state
+        "current_node_name": None,
+        "node_thinking_text": {},  # {node_name: accumulated_tokens}
+        "node_start_times": {},  # Track when each node started
+        "token_callback": None,  # Handler buffering tokens for the UI
+        "token_version": 0,  # Last handler version copied into session state
+        "update_queue": None,  # queue.Queue fed by the generation worker thread
+        "last_completed_node": None,
+        "generation_notice": None,  # (kind, text) from a cancelled or failed run
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
 
 # Initialize on app load
 init_session_state()
@@ -103,25 +163,20 @@ init_session_state()
 # Agent Output Fragment (Auto-Updating)
 # ============================================
 
-@st.fragment(run_every=0.1 if st.session_state.streaming_active else None)
+@st.fragment(run_every=SIDEBAR_POLL_INTERVAL if st.session_state.streaming_active else None)
 def agent_output_fragment():
     """Simplified sidebar for current agent status."""
 
     if st.session_state.streaming_active:
         # Header with Braze logo
-        st.html("""
-        <div class="agent-sidebar-header">
-            <div class="braze-logo-small"></div>
-            <span>Active Agent</span>
-        </div>
-        """)
+        st.html(AGENT_SIDEBAR_HEADER_HTML)
 
         # Current agent name
         if st.session_state.current_agent:
             st.caption(f"🤖 {st.session_state.current_agent}")
 
         # Thinking spinner
-        st.html('<div class="thinking-spinner"></div>')
+        st.html(THINKING_SPINNER_HTML)
 
     elif st.session_state.get("agent_output") == "":
         st.caption("Agent will activate during generation...")
@@ -135,11 +190,10 @@ st.markdown('<div class="main-container">', unsafe_allow_html=True)
 
 # Load and encode the Braze logo
 logo_path = Path(__file__).parent / "assets" / "braze-logo.webp"
-if logo_path.exists():
-    with open(logo_path, "rb") as f:
-        logo_data = base64.b64encode(f.read()).decode()
+try:
+    logo_data = _read_base64_asset(str(logo_path), logo_path.stat().st_mtime)
     logo_html = f'<img src="data:image/webp;base64,{logo_data}" alt="Braze" class="braze-logo-large">'
-else:
+except FileNotFoundError:
     # Fallback if logo not found
     logo_html = '<div class="braze-logo-large" style="background: #ea580c; border-radius: 50%;"></div>'
 
@@ -206,11 +260,76 @@ with st.container():
                     validated=True
                 )
                 st.session_state.api_config = config
-                st.session_state.orchestrator.set_braze_api_config(config)
                 st.success("✅ API configuration validated. Ready to generate.")
             except Exception as e:
                 st.error(f"❌ Validation error: {str(e)}")
 
+# ============================================
+# Generation Handler
+# ============================================
+
+def start_generation() -> None:
+    """Start a generation run (on_click callback of the Generate button).
+
+    Callbacks run before the script body, so the same run already renders
+    the inputs disabled and starts the polling fragments; no extra rerun is
+    needed. Validation and startup problems are reported through
+    generation_notice.
+    """
+    prompt = st.session_state.prompt_input
+    if not st.session_state.api_config:
+        st.session_state.generation_notice = ("error", "❌ Please validate your API configuration first")
+        return
+    if not prompt:
+        st.session_state.generation_notice = ("error", "❌ Please describe what you want to generate")
+        return
+
+    from braze_code_gen.ui.streamlit_callbacks import StreamlitTokenCallbackHandler
+
+    # Build (or fetch) the shared orchestrator before touching streaming state,
+    # so a failed build leaves the session ready for another attempt
+    try:
+        orchestrator = get_orchestrator()
+    except Exception as e:
+        logger.error(f"Failed to create orchestrator: {e}", exc_info=True)
+        st.session_state.generation_notice = ("error", f"❌ Failed to load agents: {e}")
+        return
+
+    # Initialize streaming state
+    st.session_state.streaming_active = True
+    st.session_state.stop_event.clear()  # Reset stop event
+    st.session_state.node_states = {}
+    st.session_state.node_thinking_text = {}
+    st.session_state.current_node_name = None
+    st.session_state.last_completed_node = None
+    st.session_state.agent_output = ""
+    st.session_state.current_agent = ""
+    st.session_state.generation_complete = False
+    st.session_state.generation_notice = None
+
+    # Create callback handler for token streaming
+    token_callback = StreamlitTokenCallbackHandler(stop_event=st.session_state.stop_event)
+    st.session_state.token_callback = token_callback
+    st.session_state.token_version = 0
+
+    # Run the workflow off the script thread; the progress fragment drains
+    # the queue, so the UI (including the Stop button) stays responsive
+    updates: "queue.Queue[dict]" = queue.Queue()
+    st.session_state.update_queue = updates
+    Thread(
+        target=run_generation,
+        args=(
+            orchestrator,
+            prompt,
+            st.session_state.api_config,
+            token_callback,
+            st.session_state.stop_event,
+            updates
+        ),
+        name="braze-generation",
+        daemon=True
+    ).start()
+
 # ============================================
 # Prompt Panel
 # ============================================
@@ -234,12 +353,13 @@ with st.container():
     col1, col2 = st.columns([3, 1])
 
     with col1:
-        generate = st.button(
+        st.button(
             "Generate Landing Page",
             type="primary",
             use_container_width=True,
             disabled=st.session_state.streaming_active or not st.session_state.api_config,
-            key="generate_btn"
+            key="generate_btn",
+            on_click=start_generation
         )
 
     with col2:
@@ -257,28 +377,172 @@ with st.container():
 # Generation Progress with Token Streaming
 # ============================================
 
-@st.fragment(run_every=0.1 if st.session_state.streaming_active else None)
+def run_generation(
+    orchestrator: "Orchestrator",
+    prompt: str,
+    api_config: BrazeAPIConfig,
+    token_callback: "StreamlitTokenCallbackHandler",
+    stop_event: Event,
+    updates: "queue.Queue[dict]"
+) -> None:
+    """Iterate generate_streaming on a worker thread and queue its updates.
+
+    Runs without a Streamlit script context, so it never touches st.* or
+    session state; the progress fragment applies the queued updates.
+
+    Args:
+        orchestrator: Shared orchestrator
+        prompt: User's feature request
+        api_config: This session's Braze API configuration
+        token_callback: Callback handler buffering streamed tokens
+        stop_event: Cancellation event
+        updates: Queue receiving update dicts, ending with {"type": "done"}
+    """
+    try:
+        for update in orchestrator.generate_streaming(
+            user_message=prompt,
+            max_refinement_iterations=3,
+            callbacks=[token_callback],
+            stop_event=stop_event,
+            braze_api_config=api_config
+        ):
+            if update.get("type") == "node_complete":
+                # The graph is paused between nodes here, so everything
+                # buffered so far was produced by this node
+                update = {**update, "thinking": token_callback.drain()}
+            updates.put(update)
+            if update.get("type") in ("cancelled", "error"):
+                break
+
+    except KeyboardInterrupt:
+        # Expected control flow (raised by the token callback on Stop): no traceback
+        logger.info("Generation cancelled by user")
+        updates.put({"type": "cancelled", "message": "Streaming cancelled by user"})
+
+    except Exception as e:
+        # Only genuinely unexpected failures pay for traceback formatting
+        logger.error(f"Error during generation: {e}", exc_info=True)
+        updates.put({"type": "error", "message": str(e)})
+
+    finally:
+        updates.put({"type": "done"})
+
+
+def apply_update(update: dict) -> None:
+    """Apply one queued workflow update to session state.
+
+    Args:
+        update: Update dict from run_generation
+    """
+    update_type = update.get("type")
+
+    if update_type == "node_start":
+        # Node starting - set as current active node
+        node_name = update.get("node", "Unknown")
+        st.session_state.current_node_name = node_name
+        st.session_state.node_thinking_text[node_name] = ""  # Initialize empty
+
+        # Mark as running in node_states
+        st.session_state.node_states[node_name] = {
+            "status": "running",
+            "message": f"{node_name} in progress..."
+        }
+
+    elif update_type == "node_complete":
+        # Node completed - update state
+        node_name = update.get("node", "Unknown")
+        status_msg = update.get("status", "")
+        st.session_state.node_states[node_name] = {
+            "status": "success",
+            "message": status_msg if status_msg else f"{node_name} completed"
+        }
+        thinking = update.get("thinking")
+        if thinking:
+            st.session_state.node_thinking_text[node_name] = thinking[-THINKING_TAIL_CHARS:]
+        st.session_state.last_completed_node = node_name
+
+        # Clear current node tracking (node is done)
+        if st.session_state.current_node_name == node_name:
+            st.session_state.current_node_name = None
+
+    elif update_type == "complete":
+        # Store results
+        st.session_state.export_path = update.get("export_file_path")
+        st.session_state.branding_data = update.get("branding_data")
+        st.session_state.generation_complete = True
+
+    elif update_type == "cancelled":
+        message = update.get("message", "Generation cancelled by user")
+        st.session_state.generation_notice = ("info", f"🛑 {message}")
+
+    elif update_type == "error":
+        error_msg = update.get("message", "Unknown error")
+        st.session_state.generation_notice = ("error", f"❌ Generation Failed: {error_msg}")
+
+    elif update_type == "done":
+        st.session_state.streaming_active = False
+
+
+def sync_token_callback() -> None:
+    """Copy the callback handler's agent status into session state.
+
+    The handler runs on LangChain threads and only records; all session state
+    writes happen here, on the script thread.
+    """
+    handler = st.session_state.token_callback
+    if handler is None:
+        return
+    # Nothing new since the last sync: skip the state writes
+    version = handler.version
+    if version == st.session_state.token_version:
+        return
+    st.session_state.current_agent = handler.current_agent
+    st.session_state.agent_output = handler.last_output
+    st.session_state.token_version = version
+
+
+def drain_updates() -> None:
+    """Apply every update the worker has queued since the last tick."""
+    updates = st.session_state.update_queue
+    if updates is not None:
+        while True:
+            try:
+                update = updates.get_nowait()
+            except queue.Empty:
+                break
+            apply_update(update)
+    sync_token_callback()
+
+
+@st.fragment(run_every=PROGRESS_POLL_INTERVAL if st.session_state.streaming_active else None)
 def progress_display_fragment():
     """Auto-updating fragment for real-time progress with token streaming."""
+    if st.session_state.streaming_active:
+        drain_updates()
+        if not st.session_state.streaming_active:
+            # Worker finished: rerun the app once to re-enable the inputs and
+            # show the results or the error
+            st.rerun()
 
     if st.session_state.node_states:
         with st.container():
-            st.html('<div class="status-card-header">⚙️ Generation Progress</div>')
+            st.html(STATUS_HEADER_HTML)
 
-            # Define node order for consistent display
-            node_order = ["planning", "research", "code_generation", "validation", "refinement", "finalization"]
+            # Read session state once per tick rather than per node
+            node_states = st.session_state.node_states
+            active_node = (st.session_state.current_node_name
+                           if st.session_state.streaming_active else None)
 
-            for node_name in node_order:
-                if node_name not in st.session_state.node_states:
+            for node_name in NODE_ORDER:
+                node_data = node_states.get(node_name)
+                if node_data is None:
                     continue
 
-                node_data = st.session_state.node_states[node_name]
                 status = node_data.get("status", "pending")
                 message = node_data.get("message", node_name)
 
                 # Determine if this is the currently active node
-                is_active = (st.session_state.current_node_name == node_name and
-                           st.session_state.streaming_active)
+                is_active = node_name == active_node
 
                 if status == "running" or is_active:
                     # ACTIVE NODE - Show spinner + token stream
@@ -291,12 +555,12 @@ def progress_display_fragment():
                         </div>
                         ''')
 
-                        # Token stream display (expandable)
+                        # Token stream display (a single element; an always-open
+                        # expander only added a container to re-diff every tick)
                         thinking_text = st.session_state.node_thinking_text.get(node_name, "")
                         if thinking_text:
-                            with st.expander("🧠 Agent Thinking (Live)", expanded=True):
-                                st.markdown(f'<div class="thinking-container">{thinking_text}</div>',
-                                          unsafe_allow_html=True)
+                            st.markdown(f'**🧠 Agent Thinking (Live)**\n<div class="thinking-container">{thinking_text}</div>',
+                                      unsafe_allow_html=True)
 
                 elif status == "success":
                     # COMPLETED NODE - Green checkmark
@@ -310,159 +574,73 @@ def progress_display_fragment():
                     # PENDING NODE - Grey info
                     st.info(f"⋯ {message}")
 
+            # Output of the most recently finished node while streaming
+            last_node = st.session_state.last_completed_node
+            if st.session_state.streaming_active and last_node:
+                thinking_text = st.session_state.node_thinking_text.get(last_node, "")
+                if thinking_text:
+                    with st.expander(f"✓ {last_node} - Final Output ({len(thinking_text)} chars)", expanded=False):
+                        st.markdown(f'<div class="thinking-container">...{thinking_text[-500:]}</div>',
+                                  unsafe_allow_html=True)
+
 # Render the fragment
 progress_display_fragment()
 
+# Cancellation or error reported by the last run
+if st.session_state.generation_notice:
+    notice_kind, notice_text = st.session_state.generation_notice
+    if notice_kind == "error":
+        st.error(notice_text)
+    else:
+        st.info(notice_text)
+
 # ============================================
 # Results Panel (after completion)
 # ============================================
 
-if st.session_state.generation_complete:
+def render_results_panel():
+    """Render the completion card with the download button."""
     with st.container():
-        st.html('<div class="success-card-header">✅ Generation Complete</div>')
+        st.html(SUCCESS_HEADER_HTML)
 
         col1 = st.columns(1)[0]  # Single column for download button only
 
         with col1:
-            if st.session_state.export_path and Path(st.session_state.export_path).exists():
+            export_data = None
+            export_path = st.session_state.export_path
+            if export_path:
+                try:
+                    export_data = _read_export_bytes(export_path, Path(export_path).stat().st_mtime)
+                except FileNotFoundError:
+                    pass
+
+            if export_data is not None:
                 st.markdown('<div class="download-button">', unsafe_allow_html=True)
-                with open(st.session_state.export_path, "rb") as f:
-                    st.download_button(
-                        label="📥 Download HTML",
-                        data=f,
-                        file_name="braze_landing_page.html",
-                        mime="text/html",
-                        type="primary",
-                        use_container_width=True
-                    )
+                st.download_button(
+                    label="📥 Download HTML",
+                    data=export_data,
+                    file_name="braze_landing_page.html",
+                    mime="text/html",
+                    type="primary",
+                    use_container_width=True
+                )
                 st.markdown('</div>', unsafe_allow_html=True)
             else:
                 st.error("Export file not found")
 
-# ============================================
-# Generation Handler
-# ============================================
 
-from braze_code_gen.ui.streamlit_callbacks import StreamlitTokenCallbackHandler
+if st.session_state.generation_complete:
+    render_results_panel()
 
-# Generate button handler
-if generate:
-    if not st.session_state.api_config:
-        st.error("❌ Please validate your API configuration first")
-    elif not prompt:
-        st.error("❌ Please describe what you want to generate")
-    else:
-        # Initialize streaming state
-        st.session_state.streaming_active = True
-        st.session_state.stop_event.clear()  # Reset stop event
-        st.session_state.node_states = {}
-        st.session_state.agent_output = ""
-        st.session_state.current_agent = ""
-        st.session_state.generation_complete = False
-
-        # Create callback handler for token streaming
-        token_callback = StreamlitTokenCallbackHandler()
-
-        # Status container for dynamic updates
-        status_container = st.empty()
-
-        # Create a placeholder for token streaming display
-        token_stream_placeholder = st.empty()
-
-        # Counter for periodic UI updates during token streaming
-        token_update_counter = 0
-
-        try:
-            # Stream from orchestrator (pass stop_event for UI-agnostic cancellation)
-            for update in st.session_state.orchestrator.generate_streaming(
-                user_message=prompt,
-                max_refinement_iterations=3,
-                callbacks=[token_callback],
-                stop_event=st.session_state.stop_event  # Pass threading.Event
-            ):
-                update_type = update.get("type")
-
-                if update_type == "node_start":
-                    # Node starting - set as current active node (NEW)
-                    node_name = update.get("node", "Unknown")
-                    st.session_state.current_node_name = node_name
-                    st.session_state.node_thinking_text[node_name] = ""  # Initialize empty
-
-                    # Mark as running in node_states
-                    st.session_state.node_states[node_name] = {
-                        "status": "running",
-                        "message": f"{node_name} in progress..."
-                    }
-
-                    # Update token stream display placeholder
-                    with token_stream_placeholder.container():
-                        st.info(f"🧠 {node_name} starting...")
-
-                elif update_type == "node_complete":
-                    # Node completed - update state
-                    node_name = update.get("node", "Unknown")
-                    status_msg = update.get("status", "")
-                    st.session_state.node_states[node_name] = {
-                        "status": "success",
-                        "message": status_msg if status_msg else f"{node_name} completed"
-                    }
-
-                    # Display final tokens for this node before clearing
-                    thinking_text = st.session_state.node_thinking_text.get(node_name, "")
-                    if thinking_text:
-                        with token_stream_placeholder.container():
-                            with st.expander(f"✓ {node_name} - Final Output ({len(thinking_text)} chars)", expanded=False):
-                                st.markdown(f'<div class="thinking-container">{thinking_text[:500]}...</div>',
-                                          unsafe_allow_html=True)
-
-                    # Clear current node tracking (node is done - NEW)
-                    if st.session_state.current_node_name == node_name:
-                        st.session_state.current_node_name = None
-
-                    # Update status display
-                    with status_container.container():
-                        st.html('<div class="status-card-header">⚙️ Generation Progress</div>')
-                        for node, data in st.session_state.node_states.items():
-                            if data["status"] == "success":
-                                st.success(f"✓ {data['message']}")
-                            elif data["status"] == "running":
-                                st.info(f"⚙️ {data['message']}")
-                            elif data["status"] == "error":
-                                st.error(f"✗ {data['message']}")
-
-                elif update_type == "complete":
-                    # Store results
-                    st.session_state.export_path = update.get("export_file_path")
-                    st.session_state.branding_data = update.get("branding_data")
-                    st.session_state.generation_complete = True
-
-                elif update_type == "cancelled":
-                    st.info("🛑 Generation cancelled by user")
-                    break
-
-                elif update_type == "error":
-                    error_msg = update.get("message", "Unknown error")
-                    st.error(f"❌ Generation Failed: {error_msg}")
-                    break
-
-        except KeyboardInterrupt:
-            st.info("🛑 Streaming cancelled by user")
-
-        except Exception as e:
-            logger.error(f"Error during generation: {e}", exc_info=True)
-            st.error(f"❌ Error: {str(e)}")
-
-        finally:
-            # Clean up
-            st.session_state.streaming_active = False
-            st.rerun()
+# ============================================
+# Stop Handler
+# ============================================
 
-# Stop button handler
+# Stop button handler. streaming_active stays set until the worker reports
+# that it has stopped, so its final updates are still applied.
 if stop:
     st.session_state.stop_event.set()  # Signal cancellation via threading.Event
-    st.session_state.streaming_active = False
     st.info("Cancellation requested...")
-    st.rerun()
 
 # Close main container
 st.markdown('</div>', unsafe_allow_html=True)
@@ -1,6 +1,7 @@
 """LangChain callback handlers for Streamlit token streaming."""
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional
 
 from langchain_core.callbacks.base import BaseCallbackHandler
@@ -12,14 +13,35 @@ logger = logging.getLogger(__name__)
 class StreamlitTokenCallbackHandler(BaseCallbackHandler):
     """Callback handler for token-level streaming to Streamlit.
 
-    This handler intercepts LLM token generation and updates Streamlit
-    session state for real-time display in the UI.
+    This handler intercepts LLM token generation and buffers it for real-time
+    display. It may run on a LangChain worker thread, so it never writes
+    Streamlit session state; the UI copies its state over on the script
+    thread (see streamlit_app.sync_token_callback), and run_generation drains
+    the buffered tokens into each node_complete update (see drain()).
     """
 
-    def __init__(self):
-        """Initialize callback handler."""
-        self.text = ""
+    # Check for cancellation every this many tokens (must be a power of two)
+    STOP_CHECK_INTERVAL = 16
+
+    def __init__(self, stop_event: Optional[threading.Event] = None):
+        """Initialize callback handler.
+
+        Must be called on the script thread when stop_event is omitted.
+
+        Args:
+            stop_event: Cancellation event (defaults to st.session_state.stop_event)
+        """
+        self._stop_event = stop_event if stop_event is not None else st.session_state.stop_event
+        self._token_count = 0
         self.current_agent = ""
+        self.last_output = ""
+        # Tokens streamed since the last drain() (the current node's output);
+        # the current LLM call's tokens start at _call_start
+        self._tokens: List[str] = []
+        self._call_start = 0
+        self._lock = threading.Lock()
+        # Bumped whenever there is something new for the UI to pick up
+        self.version = 0
 
     def on_llm_start(
         self,
@@ -34,21 +56,16 @@ class StreamlitTokenCallbackHandler(BaseCallbackHandler):
             prompts: Input prompts
             **kwargs: Additional arguments
         """
-        # Clear previous output
-        st.session_state.agent_output = ""
-        self.text = ""
+        # The new call's output starts after whatever is already buffered
+        with self._lock:
+            self._call_start = len(self._tokens)
 
         # Detect which agent is running (from kwargs or serialized)
         agent_name = kwargs.get("tags", ["Unknown Agent"])[0] if "tags" in kwargs else "Agent"
-        st.session_state.current_agent = agent_name
+        self.current_agent = agent_name
+        self.version += 1
 
-        # NEW: Track current node for inline display
-        if st.session_state.current_node_name:
-            # Initialize thinking text for this node if not exists
-            if st.session_state.current_node_name not in st.session_state.node_thinking_text:
-                st.session_state.node_thinking_text[st.session_state.current_node_name] = ""
-
-        logger.info(f"LLM started for {agent_name}")
+        logger.debug("LLM started for %s", agent_name)
 
     def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Called when LLM generates a new token.
@@ -57,18 +74,39 @@ class StreamlitTokenCallbackHandler(BaseCallbackHandler):
             token: New token string
             **kwargs: Additional arguments
         """
-        # Check for cancellation via threading.Event (UI-agnostic)
-        if st.session_state.stop_event.is_set():
+        # Check for cancellation via threading.Event (UI-agnostic), at a
+        # token-count checkpoint rather than on every token
+        self._token_count += 1
+        if (self._token_count & (self.STOP_CHECK_INTERVAL - 1) == 0
+                and self._stop_event.is_set()):
             logger.info("Token streaming cancelled by user")
             raise KeyboardInterrupt("Streaming cancelled by user")
 
-        # Accumulate tokens
-        self.text += token
-        st.session_state.agent_output = self.text  # Keep for sidebar compatibility
+        # Accumulate tokens (joined only when read, see text and drain())
+        with self._lock:
+            self._tokens.append(token)
+            self.version += 1
+
+    @property
+    def text(self) -> str:
+        """Full output of the current LLM call."""
+        with self._lock:
+            return "".join(self._tokens[self._call_start:])
+
+    def drain(self) -> str:
+        """Return and clear the tokens buffered since the last drain.
 
-        # Also accumulate for current node's inline display
-        if st.session_state.current_node_name:
-            st.session_state.node_thinking_text[st.session_state.current_node_name] += token
+        Called by run_generation when a node completes, so the chunk is that
+        node's full streamed output.
+
+        Returns:
+            str: Concatenated buffered tokens (empty if none arrived)
+        """
+        with self._lock:
+            chunk = "".join(self._tokens)
+            self._tokens.clear()
+            self._call_start = 0
+        return chunk
 
     def on_llm_end(self, response: Any, **kwargs: Any) -> None:
         """Called when LLM finishes generating.
@@ -77,8 +115,10 @@ class StreamlitTokenCallbackHandler(BaseCallbackHandler):
             response: LLM response
             **kwargs: Additional arguments
         """
-        # Keep final output in session state
-        logger.info(f"LLM completed for {st.session_state.current_agent}")
+        # Keep final output for the UI
+        self.last_output = self.text
+        self.version += 1
+        logger.debug("LLM completed for %s", self.current_agent)
 
     def on_llm_error(self, error: Exception, **kwargs: Any) -> None:
         """Called when LLM encounters an error.
@@ -88,5 +128,6 @@ class StreamlitTokenCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         error_msg = f"\n\n❌ Error: {str(error)}"
-        st.session_state.agent_output += error_msg
+        self.last_output = self.text + error_msg
+        self.version += 1
         logger.error(f"LLM error: {error}")
@@ -1,5 +1,6 @@
 """Utility modules for the Braze Code Generator."""
 
 from .html_utils import clean_html_response
+from .cache import TTLCache
 
-__all__ = ['clean_html_response']
+__all__ = ['clean_html_response', 'TTLCache']
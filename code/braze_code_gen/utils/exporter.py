@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class HTMLExporter:
     """Exporter for landing page HTML files."""
 
+    # Export directories already created in this process
+    _ensured_dirs: set = set()
+
     def __init__(self, export_dir: str = "/tmp/braze_exports"):
         """Initialize the HTML exporter.
 
@@ -28,7 +31,9 @@ class HTMLExporter:
             export_dir: Directory for exported files
         """
         self.export_dir = Path(export_dir)
-        self.export_dir.mkdir(parents=True, exist_ok=True)
+        if str(self.export_dir) not in HTMLExporter._ensured_dirs:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            HTMLExporter._ensured_dirs.add(str(self.export_dir))
         logger.info(f"HTML exporter initialized: {self.export_dir}")
 
     def export_landing_page(
@@ -74,7 +79,14 @@ class HTMLExporter:
         html_with_metadata = self._add_metadata_comment(html_content, metadata)
 
         # Write HTML file
-        with open(filepath, 'w', encoding='utf-8') as f:
+        try:
+            f = open(filepath, 'w', encoding='utf-8')
+        except FileNotFoundError:
+            # The directory was removed after it was first created (e.g. a
+            # /tmp cleanup); recreate it rather than failing the export
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            f = open(filepath, 'w', encoding='utf-8')
+        with f:
             f.write(html_with_metadata)
 
         logger.info(f"Exported landing page to: {filepath}")
@@ -14,23 +14,30 @@ def clean_html_response(html_content: str) -> str:
         >>> clean_html_response("```html\\n<html>...</html>\\n```")
         "<!DOCTYPE html>\\n<html>...</html>"
     """
-    # Remove markdown code blocks
-    if "```html" in html_content:
-        html_content = html_content.split("```html")[1]
-        if "```" in html_content:
-            html_content = html_content.split("```")[0]
-    elif "```" in html_content:
+    # Remove markdown code blocks (find/slice once instead of repeated split())
+    start = html_content.find("```html")
+    if start >= 0:
+        start += len("```html")
+        # The block ends at the next fence, but never past a second ```html
+        limit = html_content.find("```html", start)
+        if limit < 0:
+            limit = len(html_content)
+        end = html_content.find("```", start, limit)
+        html_content = html_content[start:end if end >= 0 else limit]
+    else:
         # Generic code block
-        parts = html_content.split("```")
-        if len(parts) >= 2:
-            html_content = parts[1]
+        start = html_content.find("```")
+        if start >= 0:
+            start += len("```")
+            end = html_content.find("```", start)
+            html_content = html_content[start:end] if end >= 0 else html_content[start:]
 
     # Strip whitespace
     html_content = html_content.strip()
 
-    # Ensure starts with DOCTYPE
-    if not html_content.upper().startswith("<!DOCTYPE"):
-        if html_content.upper().startswith("<HTML"):
+    # Ensure starts with DOCTYPE (only the prefix is case-folded, not the document)
+    if html_content[:9].upper() != "<!DOCTYPE":
+        if html_content[:5].upper() == "<HTML":
             html_content = "<!DOCTYPE html>\n" + html_content
 
     return html_content
@@ -0,0 +1,86 @@
+"""Prompt assembly helpers that keep the static prompt prefix cacheable."""
+
+import hashlib
+import logging
+from typing import List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from braze_code_gen.core.llm_factory import get_llm_factory
+from braze_code_gen.core.models import ModelProvider
+
+logger = logging.getLogger(__name__)
+
+
+def build_messages(
+    static_system: str,
+    static_reference_blocks: Sequence[str],
+    dynamic_user: str,
+    dynamic_tools: Optional[Sequence[str]] = None
+) -> List[BaseMessage]:
+    """Build an LLM message list with a fixed static-then-dynamic ordering.
+
+    Provider prompt caches match on the longest identical prefix, so the
+    order is always: static system prompt, static reference blocks, dynamic
+    user brief, dynamic tool outputs. Nothing user-specific may be placed in
+    the static arguments. For Anthropic, which only caches up to an explicit
+    breakpoint, the static system block is marked with ``cache_control``.
+
+    Args:
+        static_system: Static system instructions (module-level constant)
+        static_reference_blocks: Static reference material appended to the system prompt
+        dynamic_user: Per-request brief (feature plan, branding, base template, ...)
+        dynamic_tools: Optional per-request tool outputs (e.g. research results)
+
+    Returns:
+        List[BaseMessage]: System message followed by the dynamic human messages
+
+    Raises:
+        TypeError: If a static block is not a plain string
+    """
+    static_blocks = [static_system, *static_reference_blocks]
+    for block in static_blocks:
+        if not isinstance(block, str):
+            raise TypeError(f"Static prompt blocks must be str, got {type(block).__name__}")
+
+    static_prefix = "\n\n".join(static_blocks)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # The digest should stay constant across calls; a change means dynamic
+        # content leaked into the static prefix and the cache is being busted.
+        digest = hashlib.sha1(static_prefix.encode("utf-8")).hexdigest()[:12]
+        logger.debug(
+            "Static prompt prefix: %d chars (~%d tokens), sha1=%s",
+            len(static_prefix), len(static_prefix) // 4, digest
+        )
+
+    messages: List[BaseMessage] = [
+        _static_system_message(static_prefix),
+        HumanMessage(content=dynamic_user),
+    ]
+    for tool_output in dynamic_tools or []:
+        messages.append(HumanMessage(content=tool_output))
+
+    return messages
+
+
+def _static_system_message(static_prefix: str) -> SystemMessage:
+    """Wrap the static prefix in a system message for the active provider.
+
+    OpenAI and Google cache matching prefixes automatically; Anthropic needs a
+    ``cache_control`` breakpoint on the last static block.
+
+    Args:
+        static_prefix: Joined static system prompt and reference blocks
+
+    Returns:
+        SystemMessage: System message carrying the static prefix
+    """
+    if get_llm_factory().config.provider != ModelProvider.ANTHROPIC:
+        return SystemMessage(content=static_prefix)
+
+    return SystemMessage(content=[{
+        "type": "text",
+        "text": static_prefix,
+        "cache_control": {"type": "ephemeral"},
+    }])
@@ -1,19 +1,54 @@
 """Setup script for braze_code_gen package."""
 
+import re
+
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read requirements.txt and filter out comments and empty lines
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # isolated build env without packaging
+    Requirement = None
+
+# Comments start at a '#' that opens the line or follows whitespace (pip's rule)
+COMMENT_RE = re.compile(r"(^|\s+)#.*$")
+
+
+def parse_requirements(requirements_file: Path) -> list:
+    """Read install requirements from a pip requirements file.
+
+    Comments (including trailing ones), blank lines, section header lines
+    starting with '=' and pip option lines such as ``-r`` or
+    ``--extra-index-url`` are skipped, since none of them are valid
+    install_requires entries.
+
+    Args:
+        requirements_file: Path to requirements.txt
+
+    Returns:
+        list: Normalized requirement strings
+
+    Raises:
+        packaging.requirements.InvalidRequirement: If a line is not a valid
+            requirement (checked only when packaging is installed)
+    """
+    install_requires = []
+
+    for line in requirements_file.read_text().splitlines():
+        line = COMMENT_RE.sub("", line).strip()
+        if not line or line.startswith(("-", "=")):
+            continue
+
+        if Requirement is not None:
+            line = str(Requirement(line))
+
+        install_requires.append(line)
+
+    return install_requires
+
+
 requirements_file = Path(__file__).parent / "requirements.txt"
-install_requires = []
-
-if requirements_file.exists():
-    with open(requirements_file) as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines, comments, and section headers
-            if line and not line.startswith("#") and not line.startswith("="):
-                install_requires.append(line)
+install_requires = parse_requirements(requirements_file) if requirements_file.exists() else []
 
 setup(
     name="braze_code_gen",